@@ -177,13 +177,11 @@ class Player(nodex.GameNode):
             print(self.angle, self.entity.position.x, self.entity.position.y)
 
     def render_shadow(self, alpha=PlayerConfig.SHADOW_ALPHA, color=nodex.Color.BLACK, size=PlayerConfig.SHADOW_SIZE):
-        surf = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (*color, alpha), (size // 2, size // 2), size // 2)
         w, h   = self.context.window.internal_size
         ox, oy = PlayerConfig.SHADOW_OFFSET
         self.context.renderer.draw_world(
-            self.mode7_viewport, surf,
-            position=(w // 2 - size // 2 + ox, h // 2 - size // 2 + oy)
+            self.mode7_viewport, nodex.Circle(size // 2),
+            position=(w // 2 + ox, h // 2 + oy), color=(*color, alpha)
         )
 
     def render(self):
@@ -192,14 +190,16 @@ class Player(nodex.GameNode):
                 self.billboard_viewport,
                 f"player.{self.anim.frame}.{self.anim.animation}",
                 position=self.entity.position,
-                angle=self.angle
+                angle=self.angle,
+                previous_position=self.entity.previous_position
             )
         else:
             self.context.renderer.draw(
                 self.billboard_viewport,
                 f"player_ice",
                 position=self.entity.position,
-                angle=self.angle
+                angle=self.angle,
+                previous_position=self.entity.previous_position
             )
   
         self.context.renderer.draw("mode7", "ground")
@@ -11,7 +11,11 @@ class GameScene(nodex.GameNode):
         self.player = impl.Player(self.context, "mode7", "billboard") 
         self.add_child(self.player)
         self.add_child(impl.ObstaclesManager(self.context, self.player))
-        self.temp_img_size = self.context.assets.get_image("temp").get_size()
+
+    @property
+    def temp_img_size(self):
+        # "temp" is loaded in the background, it may not exist yet when the scene is built
+        return self.context.assets.get_image("temp").get_size()
 
     def render(self):
         self.render_score()
@@ -34,7 +38,7 @@ class GameScene(nodex.GameNode):
         filled_h = (self.player.temperature / 100) * self.temp_img_size[1] - 1
         offset_y = self.temp_img_size[1] - filled_h
         if filled_h > 0:
-            self.context.overlay.draw("overlay", pygame.Rect(
+            self.context.overlay.draw("gauges", pygame.Rect(
                 (TEMP_POS[0], TEMP_POS[1] + offset_y - 1), (
                     self.temp_img_size[0],
                     filled_h
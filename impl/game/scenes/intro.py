@@ -1,4 +1,7 @@
 import nodex
+import pygame
+
+LOADING_BAR = (78, 200, 100, 2)
 
 class IntroHandler:
     def __init__(self, context : "nodex.Context"):
@@ -19,7 +22,14 @@ class IntroHandler:
                 )
         if scene == "moderngl":
             self.context.renderer.draw("background", "moderngl", position=(77, 70))
-            if self.context.timer > 5 and not self.transition_done:
+            self.render_loading()
+            if self.context.timer > 5 and self.context.loader.done and not self.transition_done:
                 self.transition_done = True
                 self.context.scenes.transition("menu", 3, ("wave", "fade"))
                 self.context.sounds.track("winter-waltz", 0.3, -1, 2000)
+
+    def render_loading(self):
+        if self.context.loader.done:
+            return
+        x, y, w, h = LOADING_BAR
+        self.context.overlay.draw("overlay", pygame.Rect(x, y, w * self.context.loader.progress, h), color=nodex.Color.WHITE)
@@ -36,7 +36,7 @@ class Persistant(nodex.GameNode):
     def _load(self):
         AssetLoader(self.context).load()
         ViewportLoader(self.context).load()
-        self.load_material_map()
+        self.context.loader.when_done(self.load_material_map)
         self._load_scenes()
         self._load_game_nodes()
 
@@ -8,18 +8,19 @@ class ViewportLoader:
         r = self.context.renderer
         r.add_viewport("background", nodex.ViewportType.PYGAME)
         r.add_viewport("mode7", nodex.ViewportType.MODE7, settings={
-            "texture" : "assets/images/grounds/main3.png",
+            "texture" : "ground",
             "texture_name" : "tex",
             "scenes" : ("main", "menu", "settings"),
             "infinite" : "assets/images/grounds/infinite.png",
-            "extra" : "assets/images/grounds/materials.png"  
+            "extra" : "materials"
         })
         r.add_viewport("billboard", nodex.ViewportType.BILLBOARD,
                        self.context.shaders.get("_outline"), settings={"reference": "mode7"})
 
         o = self.context.overlay
-        o.add_viewport("overlay", nodex.ViewportType.PYGAME)
+        # the gauges are drawn with primitives, under the overlay images framing them
+        o.add_viewport("gauges", nodex.ViewportType.BASIC)
+        o.add_viewport("overlay", nodex.ViewportType.SPRITES)
         o.add_viewport("text", nodex.ViewportType.PYGAME, self.context.shaders.get("_outline"))
         o.add_viewport("fx", nodex.ViewportType.PYGAME, self.context.shaders.get("fx"))
-        o.add_viewport("mouse", nodex.ViewportType.PYGAME)
-
+        o.add_viewport("mouse", nodex.ViewportType.SPRITES)
\ No newline at end of file
@@ -1,15 +1,63 @@
 import nodex
 import impl 
+import asyncio
 
 
 
 DISPLAY_FPS = False
+# F3 shows the frame time graph, per phase percentiles are written here on quit
+PROFILE_CSV = None
 
 # I did not have the time to integrate properly these to the settings menu, sorry ;(
 VSYNC = True
 WINDOW_SCALE = 2
+# simulation ticks per second, None runs one variable step per rendered frame
+TICK_RATE = None
+# frame rate cap, the game sleeps instead of spinning, and drops to 10 fps when unfocused
+MAX_FPS = 240
+# renders the ground below or above the native resolution depending on the frame cost
+DYNAMIC_RESOLUTION = False
+# input recording of the session, and recording to replay instead of the live input
+RECORD_INPUT = None
+REPLAY_INPUT = None
+# updates the game nodes on a second thread while the previous frame is rendered
+THREADED = False
+# no automatic garbage collection while playing, the collections run in the spare frame time
+MANAGE_GC = True
+# frames slower than this (in seconds) get their sampled call stacks written to hitches.txt
+HITCH_THRESHOLD = None
+# runs the frame loop on an asyncio event loop
+ASYNC = False
+# Chrome trace of the node updates and the rendering, written there on quit (open it in ui.perfetto.dev)
+TRACE = None
+# GPU time of the passes, read back with a two frame delay, shown with the profiler phases
+GPU_TIMING = False
+# bytes per memory category (assets, billboard_cache, sounds, globals, gl), a warning is logged
+# on scene switches when one goes over, TRACE_MEMORY also logs what grew since the last visit
+MEMORY_BUDGETS = {"assets": 64 * 2**20, "billboard_cache": 32 * 2**20, "sounds": 128 * 2**20, "gl": 128 * 2**20}
+TRACE_MEMORY = False
             
 if __name__ == "__main__":
-    context = nodex.engine.Context((256, 240), WINDOW_SCALE, VSYNC) 
+    context = nodex.engine.Context(
+        (256, 240), WINDOW_SCALE, VSYNC, TICK_RATE, 
+        profile = PROFILE_CSV is not None, 
+        max_fps = MAX_FPS, 
+        dynamic_resolution = DYNAMIC_RESOLUTION,
+        threaded = THREADED,
+        manage_gc = MANAGE_GC,
+        hitch_threshold = HITCH_THRESHOLD,
+        trace = TRACE,
+        gpu_timing = GPU_TIMING,
+        memory_budgets = MEMORY_BUDGETS,
+        trace_memory = TRACE_MEMORY
+    ) 
+    context.profiler.csv_path = PROFILE_CSV
+    if REPLAY_INPUT:
+        context.runtime.start_replay(REPLAY_INPUT)
+    if RECORD_INPUT:
+        context.runtime.start_recording(RECORD_INPUT)
     context.scenes.persistant.add_game_node(impl.Persistant(context, DISPLAY_FPS))
-    context.run()
+    if ASYNC:
+        asyncio.run(context.run_async())
+    else:
+        context.run()
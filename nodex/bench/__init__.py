@@ -0,0 +1,15 @@
+"""
+Scenario benchmarks running the real game scenes with a scripted input and a fixed dt.
+Run from the repository root (assets are loaded with relative paths):
+
+    python -m nodex.bench --headless --output build.json
+    python -m nodex.bench --headless --compare build.json
+
+The --micro switch times the per frame functions one by one instead, each run
+is compared against the previous one (bench_micro.json):
+
+    python -m nodex.bench --micro
+"""
+from .runner import run_scenario, run, compare
+from .micro import run_micro, compare_micro, BENCHMARKS, MicroBenchmark
+from .scenarios import SCENARIOS, Scenario, ScriptedInput
@@ -0,0 +1,57 @@
+import os
+import sys
+import json
+import argparse
+
+from .runner import run, compare
+from .micro import run_micro, compare_micro, BENCHMARKS
+from .scenarios import SCENARIOS
+
+# compared against when it exists, only written with --save-baseline
+BASELINES = {False: "bench_baseline.json", True: "bench_micro_baseline.json"}
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m nodex.bench")
+    parser.add_argument("scenarios", nargs="*", help="scenarios (or micro benchmarks) to run, all by default")
+    parser.add_argument("--micro", action="store_true", help="time the per frame functions instead of whole scenarios (always headless)")
+    parser.add_argument("--headless", action="store_true", help="run without a window (dummy SDL driver, standalone GL)")
+    # not stdout, importing pygame already printed its banner there
+    parser.add_argument("--output", help="file the JSON results are written to, bench.json (bench_micro.json with --micro) by default")
+    parser.add_argument("--manage-gc", action="store_true", help="let the runtime schedule the garbage collections")
+    parser.add_argument("--compare", help="baseline JSON results to compare against, bench_baseline.json (bench_micro_baseline.json with --micro) by default")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the baseline instead of comparing against it")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown reported as a regression")
+    args = parser.parse_args()
+    names = BENCHMARKS if args.micro else SCENARIOS
+    unknown = [name for name in args.scenarios if name not in names]
+    if unknown:
+        parser.error(f"unknown {'micro benchmark' if args.micro else 'scenario'} {', '.join(unknown)} (choose from {', '.join(names)})")
+    if args.compare and not args.save_baseline and not os.path.exists(args.compare):
+        parser.error(f"no baseline at {args.compare}")
+    # all of them when none is given
+    selected = args.scenarios or list(names)
+
+    if args.micro:
+        output = args.output or "bench_micro.json"
+        results = run_micro(selected)
+    else:
+        output = args.output or "bench.json"
+        results = run(selected, args.headless, args.manage_gc)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    baseline_path = args.compare or BASELINES[args.micro]
+    if args.save_baseline:
+        with open(baseline_path, "w") as f:
+            json.dump(results, f, indent=2)
+        return
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        regressions = (compare_micro if args.micro else compare)(baseline, results, args.threshold)
+        for line in regressions:
+            print(line, file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import math
+import timeit
+import platform
+import pygame
+import nodex
+import impl
+
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable
+
+from .scenarios import SCENARIOS, ScriptedInput, _game_scene
+from .runner import RESOLUTION
+
+# repeats of the timing, the fastest one is kept (the others were disturbed)
+REPEATS = 5
+# timing differences below this are noise, whatever the ratio
+MIN_DELTA_NS = 20
+
+@dataclass
+class MicroBenchmark:
+    name: str
+    # context -> the function timed, called without arguments
+    setup: Callable
+
+def _camera(context):
+    return context.renderer.camera3D("mode7")
+
+def _in_front(context, distance = 0.05):
+    """
+    A world position right in front of the camera, so it's projected and drawn.
+    """
+    camera = _camera(context)
+    return (
+        camera.position.x - math.sin(camera.rotation) * distance,
+        camera.position.y + math.cos(camera.rotation) * distance,
+        -0.01
+    )
+
+def _billboard_draw(context):
+    billboard = context.renderer.get_viewport("billboard").pass_
+    position = _in_front(context)
+    def draw():
+        billboard.draw("tree", position)
+        billboard.draw_tasks.clear()
+    return draw
+
+def _build_task(context):
+    surface = pygame.Surface((8, 8))
+    return partial(context.renderer.build_task, surface, position=(4, 4), color=None, tex="tex", asset=None, angle=0)
+
+def _player(context):
+    return _game_scene(context).player
+
+BENCHMARKS = {
+    benchmark.name: benchmark for benchmark in (
+        MicroBenchmark("math.world_to_screen",
+            lambda context: partial(nodex.world_to_screen, _in_front(context), _camera(context), RESOLUTION)),
+        MicroBenchmark("math.angle_to_frame_index",
+            lambda context: partial(nodex.angle_to_frame_index, _camera(context), (0.5, 0.5), 8, 1.0)),
+        MicroBenchmark("math.make_quad", lambda context: partial(nodex.make_quad, -1, -1, 1, 1)),
+        MicroBenchmark("math.pixels_to_ndc", lambda context: partial(nodex.pixels_to_ndc, 10, 20, 64, 32, *RESOLUTION)),
+        MicroBenchmark("BillboardPass.draw", _billboard_draw),
+        MicroBenchmark("BillboardPass._quantize",
+            lambda context: partial(context.renderer.get_viewport("billboard").pass_._quantize, 1.337)),
+        MicroBenchmark("impl.material_under",
+            lambda context: partial(impl.material_under, context, _player(context).entity.position)),
+        MicroBenchmark("Player.closest_circuit_index",
+            lambda context: partial(getattr, _player(context), "closest_circuit_index")),
+        MicroBenchmark("Renderer.build_task", _build_task),
+        MicroBenchmark("ShaderPass.update_quad",
+            lambda context: context.renderer.get_viewport("background").pass_.update_quad),
+    )
+}
+
+def _race_context():
+    """
+    A headless context a few seconds into the race scenario.
+    """
+    scenario = SCENARIOS["race"]
+    context = nodex.engine.Context(RESOLUTION, 1, False, headless = True)
+    context.runtime.replayer = ScriptedInput(context, scenario)
+    context.scenes.persistant.add_game_node(impl.Persistant(context))
+    context.loader.wait()
+    scenario.setup(context)
+    for _ in range(scenario.warmup):
+        context.runtime.frame()
+    return context
+
+def run_micro(names = None) -> dict:
+    context = _race_context()
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+        },
+        "micro": {},
+    }
+    for name in names or BENCHMARKS:
+        function = BENCHMARKS[name].setup(context)
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(REPEATS, number)) / number
+        results["micro"][name] = {"ns_per_call": best * 1e9, "calls": number}
+    return results
+
+def compare_micro(baseline : dict, results : dict, threshold = 0.1) -> list[str]:
+    """
+    Returns a line per benchmark that got slower than the baseline by more than threshold.
+    """
+    regressions = []
+    for name, current in results["micro"].items():
+        previous = baseline.get("micro", {}).get(name)
+        if previous is None:
+            continue
+        old, new = previous["ns_per_call"], current["ns_per_call"]
+        if new - old >= MIN_DELTA_NS and new > old * (1 + threshold):
+            regressions.append(f"{name}: {old:.0f} -> {new:.0f} ns (+{(new / old - 1) * 100:.1f}%)")
+    return regressions
@@ -0,0 +1,133 @@
+import time
+import tracemalloc
+import platform
+import pygame
+import numpy as np
+import nodex
+import impl
+
+from .scenarios import SCENARIOS, Scenario, ScriptedInput
+from ..engine.core.profiler import Profiler
+
+RESOLUTION = (256, 240)
+# timing differences below this are noise, whatever the ratio
+MIN_DELTA_MS = 0.1
+# frames run after the timed ones with the allocations traced, tracing slows them down
+TRACED_FRAMES = 30
+
+def _distribution(values, scale = 1):
+    values = np.asarray(values, dtype=float) * scale
+    return {
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+def run_scenario(scenario : Scenario, headless = True, window_scale = 1, manage_gc = False) -> dict:
+    context = nodex.engine.Context(RESOLUTION, window_scale, False, headless = headless, manage_gc = manage_gc, gpu_timing = True)
+    context.profiler = Profiler(context, capacity = scenario.frames, enabled = True)
+    context.runtime.replayer = ScriptedInput(context, scenario)
+    context.scenes.persistant.add_game_node(impl.Persistant(context))
+    context.loader.wait()
+    scenario.setup(context)
+    stats = context.renderer.stats
+    programs = context._gl_context.programs
+
+    for _ in range(scenario.warmup):
+        context.runtime.frame()
+
+    frame_times, uploads = [], []
+    for _ in range(scenario.frames):
+        start = time.perf_counter()
+        context.runtime.frame()
+        frame_times.append(time.perf_counter() - start)
+        uploads.append(stats.totals(stats.frame)["upload_bytes"])
+    # read before the traced frames, slower
+    phases = context.profiler.percentiles()
+    allocations = _trace_allocations(context)
+    context.runtime.collector.close()
+
+    return {
+        "frames": scenario.frames,
+        "frame_ms": _distribution(frame_times, 1000),
+        "traced_frames": TRACED_FRAMES,
+        **allocations,
+        "upload_bytes_per_frame": _distribution(uploads),
+        "phases_ms": {
+            phase: {key: value * 1000 for key, value in stats.items()}
+            for phase, stats in phases.items()
+        },
+        "final_scene": context.scenes.current_scene,
+        "programs": {
+            "compiled": programs.misses,
+            "cache_hits": programs.hits,
+            "compile_ms": programs.compile_time * 1000,
+        },
+    }
+
+def _trace_allocations(context) -> dict:
+    """
+    Runs TRACED_FRAMES frames with tracemalloc. Per frame, the blocks and bytes gained
+    by the source lines whose allocations grew (the frees at other lines don't cancel
+    them out), and the peak of the python memory above its level at the frame start,
+    which catches what is allocated and freed within the frame.
+    Memory allocated outside of python (the surface pixels) isn't seen.
+    """
+    growth_blocks, growth_bytes, peaks = [], [], []
+    tracemalloc.start()
+    try:
+        for _ in range(TRACED_FRAMES):
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            context.runtime.frame()
+            _, peak = tracemalloc.get_traced_memory()
+            differences = tracemalloc.take_snapshot().compare_to(before, "lineno")
+            growth_blocks.append(sum(stat.count_diff for stat in differences if stat.count_diff > 0))
+            growth_bytes.append(sum(stat.size_diff for stat in differences if stat.size_diff > 0))
+            peaks.append(peak - current)
+    finally:
+        tracemalloc.stop()
+    return {
+        "site_growth_blocks_per_frame": _distribution(growth_blocks),
+        "site_growth_bytes_per_frame": _distribution(growth_bytes),
+        "transient_peak_bytes_per_frame": _distribution(peaks),
+    }
+
+def run(names = None, headless = True, manage_gc = False) -> dict:
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "headless": headless,
+            "manage_gc": manage_gc,
+        },
+        "scenarios": {},
+    }
+    for name in names or SCENARIOS:
+        results["scenarios"][name] = run_scenario(SCENARIOS[name], headless, manage_gc = manage_gc)
+    return results
+
+def compare(baseline : dict, results : dict, threshold = 0.1) -> list[str]:
+    """
+    Returns a line per metric that got worse than the baseline by more than threshold.
+    """
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+        metrics = [("frame_ms", "p50"), ("frame_ms", "p95"), ("upload_bytes_per_frame", "mean")]
+        metrics += [(group, "mean") for group in ("site_growth_blocks_per_frame", "transient_peak_bytes_per_frame") if group in previous]
+        metrics += [("phases_ms", phase) for phase in current["phases_ms"] if phase in previous["phases_ms"]]
+        for group, key in metrics:
+            old, new = previous[group][key], current[group][key]
+            if group == "phases_ms":
+                old, new = old["p50"], new["p50"]
+            if group.endswith("_ms") and new - old < MIN_DELTA_MS:
+                continue
+            if old > 0 and new > old * (1 + threshold):
+                regressions.append(f"{name} {group}.{key}: {old:.3f} -> {new:.3f} (+{(new / old - 1) * 100:.1f}%)")
+    return regressions
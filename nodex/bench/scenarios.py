@@ -0,0 +1,121 @@
+import math
+import random
+import pygame
+import impl
+
+from dataclasses import dataclass
+from typing import Callable
+
+from ..engine.core.system.replay import InputFrame
+
+DT = 1 / 60
+N_SCANCODES = 512
+
+# SDL scancodes of the keys used by the scripts (the default WASD profile)
+KEY_A = 4
+KEY_D = 7
+KEY_W = 26
+KEY_SPACE = 44
+
+@dataclass
+class Scenario:
+    name: str
+    frames: int
+    setup: Callable = lambda context: None
+    # (context, frame index) -> (held scancodes, mouse position in internal pixels, left button held)
+    script: Callable = lambda context, i: ((), (0, 0), False)
+    warmup: int = 60
+    seed: int = 0
+
+class ScriptedInput:
+    """
+    Plays a scenario script through the same interface as InputReplayer, so the
+    runtime gets a fixed dt and a deterministic input.
+    """
+    def __init__(self, context, scenario : Scenario):
+        self.context = context
+        self.scenario = scenario
+        self.index = 0
+        self._previous_keys = frozenset()
+        self._previous_click = False
+        random.seed(scenario.seed)
+
+    def _keys(self, scancodes):
+        state = [False] * N_SCANCODES
+        for scancode in scancodes:
+            state[scancode] = True
+        return pygame.key.ScancodeWrapper(state)
+
+    def next_frame(self) -> InputFrame:
+        held, mouse, click = self.scenario.script(self.context, self.index)
+        held = frozenset(held)
+        scale = self.context.window.window_scale
+        frame = InputFrame(
+            DT,
+            self._keys(held),
+            self._keys(held - self._previous_keys),
+            self._keys(self._previous_keys - held),
+            (int(mouse[0] * scale), int(mouse[1] * scale)),
+            (click, False, False),
+            [click and not self._previous_click, False]
+        )
+        self._previous_keys = held
+        self._previous_click = click
+        self.index += 1
+        return frame
+
+    def close(self):
+        pass
+
+def _game_scene(context) -> "impl.GameScene":
+    return next(node for node in context.scenes["main"].nodes if isinstance(node, impl.GameScene))
+
+def _race_setup(context):
+    context.scenes.switch("main")
+    context.post_process.diseable_effect("blur")
+
+def _race_script(context, i):
+    """
+    Steers toward the next circuit point, jumps every few seconds and respawns when frozen.
+    """
+    player = _game_scene(context).player
+    if player.frozen:
+        return ((KEY_SPACE,) if i % 30 == 0 else ()), (0, 0), False
+    target = impl.CIRCUIT[(player.closest_circuit_index + 1) % len(impl.CIRCUIT)]
+    dx = target.x - player.entity.position.x
+    dy = target.y - player.entity.position.y
+    desired = math.atan2(dy, -dx)
+    diff = (desired - player.real_angle + math.pi) % (2 * math.pi) - math.pi
+    keys = [KEY_W]
+    if diff > 0.05:
+        keys.append(KEY_D)
+    elif diff < -0.05:
+        keys.append(KEY_A)
+    if i % 300 == 150:
+        keys.append(KEY_SPACE)
+    return keys, (0, 0), False
+
+def _settings_setup(context):
+    context.scenes.switch("settings")
+
+def _settings_script(context, i):
+    """
+    Hovers the buttons one after another and cycles the controls slider.
+    """
+    button = (i // 40) % 3
+    mouse = (64 + 12 + (i % 40) * 2.5, 72 + 4 + button * 35 + 10)
+    click = button == 0 and i % 120 == 20
+    return (), mouse, click
+
+def _intro_script(context, i):
+    angle = i / 60
+    return (), (128 + math.cos(angle) * 60, 150 + math.sin(angle) * 40), False
+
+SCENARIOS = {
+    scenario.name: scenario for scenario in (
+        # pygame and moderngl logos, transition to the menu, then the blurred orbit
+        Scenario("intro_menu", 900, script=_intro_script, warmup=0),
+        Scenario("race", 3600, _race_setup, _race_script),
+        Scenario("settings", 600, _settings_setup, _settings_script),
+    )
+}
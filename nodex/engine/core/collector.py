@@ -0,0 +1,125 @@
+import gc
+import time
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .context import Context
+
+# smoothing of the measured collection costs
+COST_SMOOTHING = 0.2
+# pending allocations at which the young generation is collected even without budget
+FORCE_THRESHOLD = 20000
+# times over its threshold at which an older generation is collected even without budget
+OVERDUE_FACTOR = 2
+
+class GarbageCollector:
+    def __init__(self, context : "Context", enabled = False):
+        """
+        Owns the garbage collector policy of the frame loop.
+        Once enabled, the automatic collection is turned off, and the runtime calls
+        collect with the time left in the frame: a generation over its threshold is
+        collected when the budget allows it, or regardless once it's overdue (too many
+        allocations piled up in the young one, an older one OVERDUE_FACTOR times over
+        its threshold), and the old one during scene transitions.
+        Everything alive once the assets are loaded is frozen, so that it's never
+        traversed again.
+        The time spent in any collection is reported to the profiler as "gc".
+        """
+        self.context = context
+        self.enabled = False
+        self.pause = 0
+        self.collections = 0
+        # estimated duration of a collection, per generation
+        self.costs = [0.0005, 0.001, 0.01]
+        self._frozen_at = 0
+        self._collected_transition = False
+        self._start = None
+        gc.callbacks.append(self._on_collection)
+        if enabled:
+            self.enable()
+
+    def enable(self):
+        self.enabled = True
+        gc.disable()
+
+    def disable(self):
+        self.enabled = False
+        gc.enable()
+
+    def _on_collection(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        elif self._start is not None:
+            self.pause += time.perf_counter() - self._start
+            self._start = None
+
+    def freeze(self):
+        """
+        Moves everything alive to the permanent generation.
+        """
+        gc.collect()
+        gc.freeze()
+
+    def _generation(self):
+        """
+        The oldest generation over its threshold, the same choice the automatic collection makes.
+        """
+        count, threshold = gc.get_count(), gc.get_threshold()
+        for generation in (2, 1, 0):
+            if count[generation] >= threshold[generation]:
+                return generation
+        return None
+
+    def _overdue(self):
+        """
+        The oldest generation left uncollected for too long, collected even without budget.
+        """
+        count, threshold = gc.get_count(), gc.get_threshold()
+        for generation in (2, 1):
+            if count[generation] >= threshold[generation] * OVERDUE_FACTOR:
+                return generation
+        return 0 if count[0] > FORCE_THRESHOLD else None
+
+    def _collect(self, generation):
+        start = time.perf_counter()
+        gc.collect(generation)
+        cost = time.perf_counter() - start
+        self.costs[generation] += (cost - self.costs[generation]) * COST_SMOOTHING
+        self.collections += 1
+
+    def collect(self, remaining):
+        """
+        Called at the end of the frame with the remaining frame time, in seconds.
+        """
+        if not self.enabled:
+            return
+        loader = self.context.loader
+        if loader.done and loader.loaded != self._frozen_at:
+            self._frozen_at = loader.loaded
+            self.freeze()
+            return
+        if not self.context.scenes.transition_done:
+            # the screen is covered, the old generation pause goes unnoticed
+            if not self._collected_transition:
+                self._collected_transition = True
+                self._collect(2)
+            return
+        self._collected_transition = False
+        generation = self._generation()
+        if generation is None:
+            return
+        if remaining > self.costs[generation]:
+            self._collect(generation)
+            return
+        overdue = self._overdue()
+        if overdue is not None:
+            self._collect(overdue)
+
+    def end_frame(self):
+        self.context.profiler.add("gc", self.pause, in_frame = False)
+        self.pause = 0
+
+    def close(self):
+        gc.callbacks.remove(self._on_collection)
+        if self.enabled:
+            self.disable()
@@ -1,18 +1,30 @@
+import os
 import pygame 
 import sys 
 import nodex
 
 from .runtime import Runtime 
+from .profiler import Profiler
+from .resolution import ResolutionScaler
+from .tracer import Tracer
+from .memory import MemoryReport
 from .system.input import Input
 from .system.window import Window
 from .system.gl_context import GlContext 
 from ..ressources.assets_manager import AssetsManager
+from ..ressources.texture_registry import TextureRegistry
+from ..ressources.async_loader import AsyncLoader
 from ..ressources.shaders_manager import ShaderManager
 from ..rendering.pipeline import PostProcess
 from ...misc.text.fonts_manager import FontsManager
 
 class Context:
-    def __init__(self, resolution, window_scale = 1, vsync = True):
+    def __init__(self, resolution, window_scale = 1, vsync = True, tick_rate = None, headless = False, profile = False, max_fps = 1000, dynamic_resolution = False, threaded = False, manage_gc = False, hitch_threshold = None, trace = None, gpu_timing = False, memory_budgets = None, trace_memory = False):
+        self.headless = headless
+        if headless:
+            # no window and no audio device, rendering goes to an offscreen framebuffer
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         self.shaders = ShaderManager(self)
         self._load_shaders()
@@ -21,16 +33,30 @@ class Context:
         pygame.display.set_icon(pygame.image.load("logo.png").convert_alpha())
         self._gl_context = GlContext(self)
         self._gl_context.init_shader_pass()
-        self.runtime = Runtime(self)    
+        # the dynamic resolution needs the GPU time of the frames
+        self._gl_context.gpu_timer.enabled = gpu_timing or dynamic_resolution
+        self.runtime = Runtime(self, tick_rate, max_fps = max_fps, threaded = threaded, manage_gc = manage_gc, hitch_threshold = hitch_threshold)
+        self.profiler = Profiler(self, enabled = profile)
+        # spans of the nodes, viewports and passes, written to the trace path on quit
+        self.tracer = Tracer(self, trace)
+        if trace:
+            self.tracer.enable()
+        self.memory = MemoryReport(self, memory_budgets, trace_memory)
+        self.resolution = ResolutionScaler(self, enabled = dynamic_resolution)
         self.scenes = nodex.engine.world.SceneManager(self)
         self.input = Input(self)
+        self.loader = AsyncLoader(self)
         self.assets = AssetsManager(self)
+        # GPU textures of the images, shared between the passes
+        self.textures = TextureRegistry(self)
         self.fonts = FontsManager(self)
         self.sounds = nodex.engine.sounds.SoundManager(self)
         self.renderer = nodex.engine.Renderer(self)
         self.post_process = PostProcess(self)
-        self.overlay = nodex.engine.Renderer(self)
+        self.overlay = nodex.engine.Renderer(self, "overlay")
         self.overlay.add_viewport("transition", nodex.ViewportType.PYGAME, order = float("inf"))
+        self.overlay.add_viewport("profiler", nodex.ViewportType.PYGAME, order = float("inf"))
+        self.overlay.add_viewport("stats", nodex.ViewportType.PYGAME, order = float("inf"))
         self.globals = {}
         self.timer = 0
         
@@ -43,14 +69,36 @@ class Context:
         self._load_shader("_world", "modes/world")
         self._load_shader("_fragment", "passthrough/fragment")
         self._load_shader("_vertex", "passthrough/vertex")
+        self._load_shader("_primitive_fragment", "primitives/fragment")
+        self._load_shader("_primitive_vertex", "primitives/vertex")
+        self._load_shader("_upload_vertex", "upload/vertex")
+        self._load_shader("_sprite_fragment", "sprites/fragment")
+        self._load_shader("_sprite_vertex", "sprites/vertex")
         self._load_shader("_outline", "effects/outline")
         self._load_shader("_blur", "effects/blur")
         self._load_shader("_pixel", "effects/pixel")
     
     def run(self):
         self.runtime.run()
+
+    async def run_async(self):
+        await self.runtime.run_async()
+
+    def schedule(self, coroutine):
+        """
+        Runs an asyncio coroutine alongside the frames (see Runtime.schedule).
+        """
+        return self.runtime.schedule(coroutine)
     
     def quit(self):
+        if self.runtime.in_simulation:
+            # shut down from the main thread, it may be rendering
+            self.runtime.call_on_main(self.quit)
+            return
+        self.profiler.close()
+        self.tracer.close()
+        self.memory.close()
+        self.runtime.close()
         pygame.quit()
         sys.exit()
 
@@ -58,6 +106,10 @@ class Context:
     def dt(self):
         return self.runtime.dt 
     
+    @property 
+    def alpha(self):
+        return self.runtime.alpha
+
     @property 
     def fps(self):
         return self.runtime.fps
\ No newline at end of file
@@ -0,0 +1,101 @@
+import os
+import sys
+import time
+import threading
+
+from collections import Counter
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .context import Context
+
+class HitchDetector:
+    def __init__(self, context : "Context", threshold = None, interval = 0.001, path = "hitches.txt"):
+        """
+        Samples the call stacks of the main (and simulation) thread every interval
+        seconds on a background thread. The samples are aggregated per frame, and
+        the frames that took longer than threshold seconds (pacing wait excluded)
+        get theirs appended to path, in the folded format flame graph tools read:
+        one "caller;callee;... count" line per distinct stack.
+        A None threshold disables the detector.
+        """
+        self.context = context
+        self.threshold = threshold
+        self.interval = interval
+        self.path = path
+        self.hitches = 0
+        self._frame = 0
+        self._samples = Counter()
+        self._labels = {}
+        self._main = threading.main_thread().ident
+        self._running = False
+        self._thread = None
+
+    @property
+    def enabled(self):
+        return self.threshold is not None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._sample_loop, name="nodex-hitches", daemon=True)
+        self._thread.start()
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            filename = os.path.relpath(code.co_filename) if code.co_filename.startswith(os.getcwd()) else code.co_filename
+            label = self._labels[code] = f"{filename}:{code.co_name}"
+        return label
+
+    def _stack(self, frame):
+        stack = []
+        while frame is not None:
+            stack.append(f"{self._label(frame.f_code)}:{frame.f_lineno}")
+            frame = frame.f_back
+        stack.reverse()
+        return ";".join(stack)
+
+    def _sample_loop(self):
+        while self._running:
+            time.sleep(self.interval)
+            simulation = self.context.runtime._simulation
+            threads = {self._main: "main"}
+            if simulation is not None:
+                threads[simulation.ident] = "simulation"
+            frames = sys._current_frames()
+            # the counter can be swapped by end_frame meanwhile, the sample then counts for the next frame
+            samples = self._samples
+            for ident, name in threads.items():
+                if ident in frames:
+                    samples[f"{name};{self._stack(frames[ident])}"] += 1
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.start()
+        self._samples = Counter()
+
+    def end_frame(self, duration):
+        if not self.enabled:
+            return
+        self._frame += 1
+        # swapped before reading it, the sampling thread keeps adding to the current one
+        samples, self._samples = self._samples, Counter()
+        if duration > self.threshold:
+            self.hitches += 1
+            self.dump(samples, duration)
+
+    def dump(self, samples, duration):
+        with open(self.path, "a") as f:
+            f.write(f"# frame {self._frame}: {duration * 1000:.1f} ms, {sum(samples.values())} samples\n")
+            for stack, count in samples.most_common():
+                f.write(f"{stack} {count}\n")
+            f.write("\n")
+
+    def close(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,142 @@
+import logging
+import tracemalloc
+import pygame
+import moderngl
+import numpy as np
+import nodex
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .context import Context
+
+logger = logging.getLogger("nodex.memory")
+
+# lines of the tracemalloc comparison logged on a scene switch
+TOP_GROWTH = 10
+
+def sizeof(obj) -> int:
+    """
+    Estimated bytes held by a surface, sound, array or GL object.
+    Subsurfaces share the pixels of their parent and hold nothing on their own.
+    """
+    if isinstance(obj, pygame.Surface):
+        if obj.get_parent() is not None:
+            return 0
+        return obj.get_width() * obj.get_height() * obj.get_bytesize()
+    if isinstance(obj, pygame.mixer.Sound):
+        frequency, size, channels = pygame.mixer.get_init()
+        return int(obj.get_length() * frequency) * channels * abs(size) // 8
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, moderngl.Texture):
+        return obj.width * obj.height * obj.components * int(obj.dtype[1:])
+    if isinstance(obj, moderngl.Buffer):
+        return obj.size
+    if isinstance(obj, (bytes, bytearray)):
+        return len(obj)
+    return 0
+
+class MemoryReport:
+    def __init__(self, context : "Context", budgets : dict[str, int] = None, trace = False):
+        """
+        Estimates the memory held by the assets, caches, sounds, globals and GL objects,
+        per category and per item, and logs a warning for each category over its budget
+        (in bytes). With trace, a tracemalloc snapshot is taken on every scene switch
+        and the biggest growths since the previous visit of the same scene are logged,
+        the memory a scene leaks shows up after going back and forth.
+        """
+        self.context = context
+        self.budgets = budgets or {}
+        self.trace = trace
+        self._snapshots = {}
+        if trace:
+            tracemalloc.start()
+
+    def _gl_objects(self):
+        gl_context = self.context._gl_context
+        objects = {
+            "render_tex": gl_context.render_tex,
+            "pp_tex_a": gl_context.pp_tex_a,
+            "pp_tex_b": gl_context.pp_tex_b,
+            "scaled_tex": gl_context.scaled_tex,
+            "uploader.staging": gl_context.uploader._staging,
+            "uploader.pbo": gl_context.uploader._pbo,
+        }
+        passes = {"blit": gl_context.blit_pass, "composite": gl_context.composite_pass}
+        passes |= {f"post_process.{name}": shader_pass for name, shader_pass in gl_context.pp_library.items()}
+        for renderer in (self.context.renderer, self.context.overlay):
+            for viewport in renderer.viewports.values():
+                name = f"{renderer.name}.{viewport.name}"
+                if viewport.type == nodex.ViewportType.MODE7:
+                    passes[f"{name}.static"] = viewport.pass_.static_pass
+                    passes[f"{name}.dynamic"] = viewport.pass_.dynamic_pass
+                else:
+                    passes[name] = viewport.pass_
+        for name, shader_pass in passes.items():
+            objects[f"{name}.vbo"] = shader_pass.vbo
+            objects[f"{name}.primitives"] = shader_pass.primitives._vbo
+            for texture_name, (texture, _) in shader_pass.textures.items():
+                objects[f"{name}.{texture_name}"] = texture
+        # the passes share some textures (the blit one samples render_tex), counted once
+        seen, unique = set(), {}
+        for name, obj in objects.items():
+            if obj is not None and id(obj) not in seen:
+                seen.add(id(obj))
+                unique[name] = obj
+        return unique
+
+    def _billboard_caches(self):
+        caches = {}
+        for viewport in self.context.renderer.viewports.values():
+            if viewport.type == nodex.ViewportType.BILLBOARD:
+                for (name, scale), surface in viewport.pass_._cache.items():
+                    caches[f"{viewport.name}.{name}@{scale}"] = surface
+        return caches
+
+    def report(self) -> dict[str, dict[str, int]]:
+        """
+        Bytes per item, per category.
+        """
+        categories = {
+            "assets": self.context.assets._assets,
+            "billboard_cache": self._billboard_caches(),
+            "sounds": {name: sound.sound for name, sound in self.context.sounds.sound_loader.sounds.items()},
+            "globals": self.context.globals,
+            "gl": self._gl_objects(),
+        }
+        return {
+            category: {name: size for name, obj in items.items() if (size := sizeof(obj))}
+            for category, items in categories.items()
+        }
+
+    def totals(self, report = None) -> dict[str, int]:
+        return {category: sum(items.values()) for category, items in (report or self.report()).items()}
+
+    def check(self) -> list[str]:
+        """
+        Logs and returns the categories over their budget.
+        """
+        over = []
+        for category, total in self.totals().items():
+            budget = self.budgets.get(category)
+            if budget is not None and total > budget:
+                logger.warning("%s uses %.1f MB, over its %.1f MB budget", category, total / 2**20, budget / 2**20)
+                over.append(category)
+        return over
+
+    def scene_switched(self, scene):
+        self.check()
+        if not self.trace:
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        previous = self._snapshots.get(scene)
+        self._snapshots[scene] = snapshot
+        if previous is None:
+            return
+        growths = [stat for stat in snapshot.compare_to(previous, "lineno") if stat.size_diff > 0]
+        for stat in growths[:TOP_GROWTH]:
+            logger.warning("back in %s, %s", scene, stat)
+
+    def close(self):
+        if self.trace:
+            tracemalloc.stop()
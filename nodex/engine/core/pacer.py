@@ -0,0 +1,74 @@
+import time
+import asyncio
+
+# the OS sleep overshoots by up to a scheduler quantum, the end of the wait is spun
+SPIN_MARGIN = 0.002
+# smoothing of the reported interval error
+ERROR_SMOOTHING = 0.05
+
+class FramePacer:
+    def __init__(self, target_fps = None, idle_fps = 10):
+        """
+        Waits until the next frame deadline, sleeping for most of the wait and
+        spinning the last SPIN_MARGIN seconds for a low jitter.
+        When throttled (window minimised or unfocused) the idle rate is used instead.
+        A None target doesn't wait at all.
+        The achieved interval and its smoothed error to the target are reported by the
+        runtime to the profiler, as the pacing.interval and pacing.error columns.
+        """
+        self.target_fps = target_fps
+        self.idle_fps = idle_fps
+        self.throttled = False
+        self.achieved_interval = 0
+        # smoothed difference between the achieved and the target frame interval
+        self.error = 0
+        self._deadline = None
+        self._last = time.perf_counter()
+
+    @property
+    def interval(self):
+        fps = self.idle_fps if self.throttled else self.target_fps
+        return 1 / fps if fps else 0
+
+    def _schedule(self):
+        """
+        Moves the deadline one interval forward, returns the time left until it.
+        """
+        interval = self.interval
+        if not interval:
+            return 0
+        now = time.perf_counter()
+        if self._deadline is None or now - self._deadline > interval:
+            # late by more than a frame, don't try to catch up
+            self._deadline = now
+        self._deadline += interval
+        return self._deadline - now
+
+    def _spin(self):
+        """
+        Spins until the deadline, then measures the achieved interval.
+        """
+        interval = self.interval
+        if interval:
+            while time.perf_counter() < self._deadline:
+                pass
+        now = time.perf_counter()
+        self.achieved_interval = now - self._last
+        self._last = now
+        if interval:
+            self.error += (self.achieved_interval - interval - self.error) * ERROR_SMOOTHING
+
+    def wait(self):
+        remaining = self._schedule()
+        if remaining > SPIN_MARGIN:
+            time.sleep(remaining - SPIN_MARGIN)
+        self._spin()
+
+    async def wait_async(self):
+        """
+        Same as wait, the sleeping part is handed over to the running event loop,
+        which gets at least one iteration even when there's no time left.
+        """
+        remaining = self._schedule()
+        await asyncio.sleep(max(0, remaining - SPIN_MARGIN))
+        self._spin()
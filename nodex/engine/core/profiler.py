@@ -0,0 +1,163 @@
+import csv
+import time
+import threading
+import pygame
+import numpy as np
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .context import Context
+
+GRAPH_HEIGHT = 60
+# frame time mapped to the full graph height, in seconds
+GRAPH_RANGE = 1 / 30
+PERCENTILES = (50, 95, 99)
+
+class Profiler:
+    def __init__(self, context : "Context", capacity = 240, enabled = False, csv_path = None):
+        """
+        Per phase frame timings stored in a fixed size ring buffer.
+        The runtime calls lap(phase) after each phase of the frame, the elapsed time
+        since the previous lap is added to that phase.
+        """
+        self.context = context
+        self.capacity = capacity
+        self.enabled = enabled
+        self.show_graph = False
+        self.csv_path = csv_path
+        self._columns : dict[str, int] = {}
+        # phases measured alongside the frame (eg. overlapping it), not part of its time
+        self._extra : set[str] = set()
+        self._samples = np.zeros((capacity, 0))
+        self._current : dict[str, float] = {}
+        self._index = 0
+        self._count = 0
+        self._last = 0
+        self._thread = None
+        self._graph = None
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._current.clear()
+        self._last = time.perf_counter()
+        self._thread = threading.get_ident()
+
+    def lap(self, phase):
+        # laps from the simulation thread (threaded runtime) would break the main thread ones
+        if not self.enabled or threading.get_ident() != self._thread:
+            return
+        now = time.perf_counter()
+        self._current[phase] = self._current.get(phase, 0) + now - self._last
+        self._last = now
+
+    def add(self, phase, value, in_frame = True):
+        """
+        Adds a value measured elsewhere (eg. on the GPU) to the current frame.
+        Values that aren't in_frame are reported but left out of the frame time.
+        """
+        if self.enabled:
+            self._current[phase] = self._current.get(phase, 0) + value
+            if not in_frame:
+                self._extra.add(phase)
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        row = self._samples[self._index]
+        row.fill(0)
+        for phase, value in self._current.items():
+            if phase not in self._columns:
+                self._add_column(phase)
+                row = self._samples[self._index]
+            row[self._columns[phase]] = value
+        self._index = (self._index + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _add_column(self, phase):
+        self._columns[phase] = len(self._columns)
+        self._samples = np.hstack((self._samples, np.zeros((self.capacity, 1))))
+
+    @property
+    def phases(self):
+        return list(self._columns)
+
+    def samples(self):
+        """
+        Returns the recorded frames, oldest first, one column per phase.
+        """
+        if self._count < self.capacity:
+            return self._samples[:self._count]
+        return np.roll(self._samples, -self._index, axis=0)
+
+    def _frame_columns(self):
+        return [column for phase, column in self._columns.items() if phase not in self._extra]
+
+    def frame_times(self):
+        return self.samples()[:, self._frame_columns()].sum(axis=1)
+
+    def percentiles(self):
+        samples = self.samples()
+        if not len(samples):
+            return {}
+        stats = {}
+        columns = {"frame": samples[:, self._frame_columns()].sum(axis=1)}
+        columns.update({phase: samples[:, column] for phase, column in self._columns.items()})
+        for phase, values in columns.items():
+            stats[phase] = {"mean": float(values.mean())} | {
+                f"p{p}": float(np.percentile(values, p)) for p in PERCENTILES
+            }
+        return stats
+
+    def export_csv(self, path = None):
+        path = path or self.csv_path
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["phase", "mean_ms"] + [f"p{p}_ms" for p in PERCENTILES])
+            for phase, stats in self.percentiles().items():
+                writer.writerow([phase, round(stats["mean"] * 1000, 4)] + [
+                    round(stats[f"p{p}"] * 1000, 4) for p in PERCENTILES
+                ])
+
+    def toggle_graph(self):
+        self.show_graph = not self.show_graph
+        if self.show_graph:
+            self.enabled = True
+
+    def draw_graph(self, viewport = "profiler"):
+        """
+        Draws the stacked frame time graph on the overlay, one column per frame.
+        """
+        overlay = self.context.overlay.get_viewport(viewport)
+        # written straight into the published tasks, the simulation may be filling the others
+        overlay.frame_tasks = []
+        if not self.show_graph:
+            return
+        width = min(self.capacity, self.context.window.internal_size[0])
+        if self._graph is None:
+            self._graph = pygame.Surface((width, GRAPH_HEIGHT), pygame.SRCALPHA)
+        self._graph.fill((0, 0, 0, 150))
+        samples = self.samples()[-width:, self._frame_columns()]
+        for x, row in enumerate(samples):
+            y = GRAPH_HEIGHT
+            for column, value in enumerate(row):
+                h = int(value / GRAPH_RANGE * GRAPH_HEIGHT)
+                if h:
+                    pygame.draw.line(self._graph, _phase_color(column), (x, y), (x, y - h))
+                y -= h
+        target = GRAPH_HEIGHT - int((1 / 60) / GRAPH_RANGE * GRAPH_HEIGHT)
+        pygame.draw.line(self._graph, (255, 255, 255, 120), (0, target), (width, target))
+        overlay.frame_tasks.append(self.context.overlay.build_task(
+            self._graph, position=(0, self.context.window.internal_size[1] - GRAPH_HEIGHT), 
+            color=None, tex="tex", asset=None, angle=0
+        ))
+
+    def close(self):
+        if self.enabled and self.csv_path:
+            self.export_csv()
+
+def _phase_color(column):
+    hue = (column * 67) % 360
+    color = pygame.Color(0)
+    color.hsva = (hue, 80, 100, 100)
+    return color
@@ -0,0 +1,59 @@
+import logging
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .context import Context
+
+logger = logging.getLogger("nodex.resolution")
+
+class ResolutionScaler:
+    def __init__(self, context : "Context", min_scale = 0.5, max_scale = 2.0, step = 0.25, window = 30, enabled = False):
+        """
+        Adjusts the render scale of the Mode 7 ground from the recent frame costs.
+        Every window frames, the average cost is compared to the frame budget given by
+        the runtime (see Runtime.frame_budget): over budget lowers the scale by step, well
+        under budget raises it, so strong machines end up supersampling the ground.
+        The cost of a frame is the longest of its CPU time (without the pacing wait nor
+        the flip) and its GPU time (see GpuTimer.frame_time), the draw calls returning
+        before the GPU is done with them. Frames that aren't paced have no budget, the
+        scale is left as it is.
+        """
+        self.context = context
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.step = step
+        self.window = window
+        self.enabled = enabled
+        # fractions of the frame budget outside of which the scale changes
+        self.high = 0.95
+        self.low = 0.6
+        self._costs = []
+        self._unpaced_logged = False
+
+    @property
+    def scale(self):
+        return self.context._gl_context.render_scale
+
+    def update(self, cost, budget):
+        if not self.enabled:
+            return
+        if not budget:
+            if not self._unpaced_logged:
+                self._unpaced_logged = True
+                logger.warning("dynamic resolution has no frame budget (headless or uncapped frames), the scale stays at %.2f", self.scale)
+            return
+        self._costs.append(max(cost, self.context._gl_context.gpu_timer.frame_time))
+        if len(self._costs) < self.window:
+            return
+        average = sum(self._costs) / len(self._costs)
+        self._costs.clear()
+        scale = self.scale
+        if average > budget * self.high:
+            scale -= self.step
+        elif average < budget * self.low:
+            scale += self.step
+        self.set_scale(scale)
+
+    def set_scale(self, scale):
+        scale = min(max(scale, self.min_scale), self.max_scale)
+        self.context._gl_context.set_render_scale(scale)
@@ -1,24 +1,128 @@
 import pygame
 import time
+import asyncio
+import threading
 import nodex
 
+from .pacer import FramePacer
+from .collector import GarbageCollector
+from .hitches import HitchDetector
+from collections import deque
+from concurrent.futures import Future
+from .system.replay import InputRecorder, InputReplayer
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .context import Context
 
+# assumed when the display doesn't report its refresh rate
+DEFAULT_REFRESH_RATE = 60
+
 class Runtime:
-    def __init__(self, context : "Context"):
+    def __init__(self, context : "Context", tick_rate = None, max_ticks = 5, max_fps = 1000, threaded = False, manage_gc = False, hitch_threshold = None):
+        """
+        By default the simulation runs once per rendered frame with a variable dt.
+        When a tick_rate is given, the simulation runs at that fixed rate instead,
+        catching up at most max_ticks times per frame, and the renderer receives
+        an interpolation alpha between the last two ticks.
+        Frames are paced to max_fps (None for uncapped), and throttled when the 
+        window is minimised or unfocused.
+        In threaded mode the simulation of the next frame runs on its own thread
+        while the main thread renders the previous one, the draw lists and cameras
+        being handed over (published) once per frame. Events, GL calls and asset
+        finalisation stay on the main thread.
+        With manage_gc, the garbage collections are run by the runtime, in the time
+        left at the end of the frames and during transitions (see GarbageCollector).
+        With a hitch_threshold (in seconds), the stacks sampled during the frames
+        slower than that are written to a file (see HitchDetector).
+        Coroutines scheduled with schedule run alongside the frames, on the event
+        loop running run_async, or on the runtime's own one stepped each frame by run.
+        """
         pygame.mixer.init()
-        self.context = context 
+        self.context = context
         self.clock = pygame.time.Clock()
-        self.lt = time.perf_counter() 
-        self.dt = 1    
-    
+        self.lt = time.perf_counter()
+        self.dt = 1
+        self.frame_dt = 1
+        self.tick_rate = tick_rate
+        self.max_ticks = max_ticks
+        self.accumulator = 0
+        self.alpha = 1
+        self._alpha = 1
+        self.ticks = 0
+        self.threaded = threaded
+        self._main_calls = []
+        self._simulation = None
+        self._simulation_start = threading.Event()
+        self._simulation_done = threading.Event()
+        self._simulation_error = None
+        self.recorder = None
+        self.replayer = None
+        self.pacer = FramePacer(None if context.headless else max_fps)
+        self.collector = GarbageCollector(context, enabled = manage_gc)
+        self.hitches = HitchDetector(context, hitch_threshold)
+        self._loop = None
+        self._coroutines = deque()
+
+    @property
+    def frame_budget(self):
+        """
+        Time a frame has, in seconds: the pacer interval, or the refresh interval when
+        vsync holds the frames longer. 0 when the frames aren't paced (headless).
+        """
+        interval = self.pacer.interval
+        window = self.context.window
+        if interval and window.vsync and not self.pacer.throttled:
+            interval = max(interval, 1 / (window.refresh_rate or DEFAULT_REFRESH_RATE))
+        return interval
+
+    @property
+    def fixed_step(self):
+        return self.tick_rate is not None
+
+    @property
+    def step(self):
+        return 1 / self.tick_rate
+
     def _delta_time(self):
-        self.dt = (time.perf_counter() - self.lt)  
+        self._set_frame_dt(time.perf_counter() - self.lt)
         self.lt = time.perf_counter()
 
+    def _set_frame_dt(self, dt):
+        self.frame_dt = dt
+        if not self.fixed_step:
+            self.dt = dt
+
+    def start_recording(self, path, seed = None):
+        self.recorder = InputRecorder(path, seed)
+
+    def start_replay(self, path):
+        """
+        Feeds the input and the frame dt from a recording instead of pygame and the 
+        wall clock. The context quits once the recording is over.
+        """
+        self.replayer = InputReplayer(path)
+
+    def _handle_recording(self):
+        if self.replayer is not None:
+            frame = self.replayer.next_frame()
+            if frame is None:
+                self.context.quit()
+            self.context.input.apply(frame)
+            self._set_frame_dt(frame.dt)
+        if self.recorder is not None:
+            self.recorder.write(self.context.input.snapshot(self.frame_dt))
+
+    def close(self):
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.replayer is not None:
+            self.replayer.close()
+        self.collector.close()
+        self.hitches.close()
+        if self._loop is not None and not self._loop.is_running():
+            self._loop.close()
+
     def poll_sys_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -26,35 +130,233 @@ class Runtime:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_F11:
                     self.context.window.toggle_fullscreen()
+                if event.key == pygame.K_F3:
+                    self.context.profiler.toggle_graph()
+                if event.key == pygame.K_F4:
+                    self.context.renderer.stats.toggle()
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
-                    self.context.input._mouse_pressed[0] = True 
+                    self.context.input._mouse_pressed[0] = True
                 if event.button == 3:
                     self.context.input._mouse_pressed[1] = True
-                
+
+    def tick(self):
+        # the previous tick's cameras are kept so the renderer can blend between the two
+        self.context.renderer.store_cameras()
+        self.context.renderer.clear()
+        self.context.overlay.clear()
+        self.context.scenes.update()
+        self.context.timer += self.dt
+        self.context.profiler.lap("update")
+        self.context.sounds.update()
+        self.context.profiler.lap("sounds")
+
+    def simulate(self):
+        if not self.fixed_step:
+            self.tick()
+            self.ticks = 1
+            return
+
+        self.dt = self.step
+        self.accumulator += self.frame_dt
+        ticks = 0
+        while self.accumulator >= self.step and ticks < self.max_ticks:
+            if ticks:
+                # one-shot inputs (just pressed keys, clicks) belong to the first tick only
+                self.context.input._consume()
+            self.tick()
+            self.accumulator -= self.step
+            ticks += 1
+        if ticks == self.max_ticks:
+            # too far behind, drop the backlog instead of spiraling
+            self.accumulator = min(self.accumulator, self.step)
+        self.ticks = ticks
+        self._alpha = self.accumulator / self.step
+
+    def publish(self):
+        """
+        Hands the state of the last tick over to the renderer.
+        """
+        if self.ticks:
+            self.context.renderer.publish()
+            self.context.overlay.publish()
+        self.alpha = self._alpha
+        for call, args in self._main_calls:
+            call(*args)
+        self._main_calls.clear()
+
+    def call_on_main(self, call, *args):
+        """
+        Runs call on the main thread, right away unless called from the simulation thread.
+        """
+        if self.in_simulation:
+            self._main_calls.append((call, args))
+        else:
+            call(*args)
+
+    @property
+    def in_simulation(self):
+        """
+        Whether the caller runs on the simulation thread.
+        """
+        return self._simulation is not None and threading.current_thread() is self._simulation
+
+    def _simulation_loop(self):
+        while True:
+            self._simulation_start.wait()
+            self._simulation_start.clear()
+            try:
+                self.simulate()
+            except BaseException as error:
+                self._simulation_error = error
+            self._simulation_done.set()
+
+    def _start_simulation(self):
+        if self._simulation is None:
+            self._simulation = threading.Thread(target=self._simulation_loop, name="nodex-simulation", daemon=True)
+            self._simulation.start()
+        self._simulation_done.clear()
+        self._simulation_start.set()
+
+    def _join_simulation(self):
+        if self._simulation is None:
+            return
+        self._simulation_done.wait()
+        if self._simulation_error is not None:
+            error, self._simulation_error = self._simulation_error, None
+            raise error
+
+    def render(self):
+        self.context.renderer.stats.begin_frame()
+        self.context._gl_context.before_rendering()
+        self.context.renderer.render()
+        self.context._gl_context.after_rendering()
+        self.context.overlay.render()
+        self.context._gl_context.gpu_timer.end_frame()
+
+    def schedule(self, coroutine) -> Future:
+        """
+        Runs coroutine alongside the frames, callable from any thread.
+        The returned future holds its result.
+        """
+        future = Future()
+        self._coroutines.append((coroutine, future))
+        return future
+
+    def _start_coroutines(self):
+        while self._coroutines:
+            coroutine, future = self._coroutines.popleft()
+            self._loop.create_task(_forward(coroutine, future))
+
+    def _step_loop(self):
+        """
+        Runs one iteration of the runtime's own event loop, the synchronous counterpart of wait_async.
+        """
+        if self._loop is None:
+            if not self._coroutines:
+                return
+            self._loop = asyncio.new_event_loop()
+        self._start_coroutines()
+        self._loop.run_until_complete(asyncio.sleep(0))
+        self.context.profiler.lap("async")
+
+    def _update_and_render(self):
+        profiler = self.context.profiler
+        profiler.begin_frame()
+        self.hitches.begin_frame()
+        start = time.perf_counter()
+        if self.threaded:
+            # the simulation started last frame is done, its state becomes the one rendered
+            self._join_simulation()
+            self.publish()
+            profiler.lap("sync")
+        self.context.input.reset_mouse_pressed()
+        self._delta_time()
+        self.context.input._handle_keyboard()
+        self.context.input._handle_mouse()
+
+        self.poll_sys_events()
+        self._handle_recording()
+        profiler.lap("input")
+        self.context.loader.update()
+        profiler.lap("loading")
+        if self.threaded:
+            self._start_simulation()
+        else:
+            self.simulate()
+            self.publish()
+        profiler.draw_graph()
+        self.context.renderer.stats.draw(self.context)
+        self.pacer.throttled = self.unfocused
+        if not self.pacer.throttled:
+            self.render()
+
+        # measured before the flip, which waits for the vertical blank with vsync
+        cost = time.perf_counter() - start
+        if not self.context.headless and not self.pacer.throttled:
+            pygame.display.flip()
+            profiler.lap("flip")
+        budget = self.frame_budget
+        self.context.resolution.update(cost, budget)
+        self.collector.collect(budget - cost)
+        profiler.lap("collect")
+        self.collector.end_frame()
+        self.hitches.end_frame(time.perf_counter() - start)
+
+    def _end_frame(self):
+        self.clock.tick()
+        profiler = self.context.profiler
+        profiler.lap("wait")
+        # how well the frames are paced, reported next to the phases but not part of the frame
+        profiler.add("pacing.interval", self.pacer.achieved_interval, in_frame = False)
+        profiler.add("pacing.error", self.pacer.error, in_frame = False)
+        profiler.end_frame()
+
+    def frame(self):
+        self._update_and_render()
+        self._step_loop()
+        self.pacer.wait()
+        self._end_frame()
+
+    async def frame_async(self):
+        """
+        Same as frame, the pacing wait is spent in the running event loop.
+        """
+        self._update_and_render()
+        self._start_coroutines()
+        await self.pacer.wait_async()
+        self._end_frame()
+
     def run(self):
-        while True: 
-            self.context.input.reset_mouse_pressed()   
-            self._delta_time()
-            self.context.input._handle_keyboard()
-            
-            self.poll_sys_events()
-            self.context.scenes.update()
-            self.context._gl_context.before_rendering() 
-            self.context.renderer.render()
-            self.context._gl_context.after_rendering()
-            self.context.overlay.render()
-            
-            pygame.display.flip() 
-            self.clock.tick(1000) 
-            self.context.timer += self.dt 
-            self.context.renderer.clear()
-            self.context.sounds.update()
-             
+        while True:
+            self.frame()
+
+    async def run_async(self):
+        """
+        The frame loop as a coroutine, to run on an asyncio event loop shared with other work.
+        """
+        if self._loop is not None and not self._loop.is_running():
+            # coroutines already started on the runtime's own loop would never resume
+            raise RuntimeError("run_async must be used from the start, before any frame ran")
+        self._loop = asyncio.get_running_loop()
+        while True:
+            await self.frame_async()
+
+    @property
+    def unfocused(self):
+        if self.context.headless:
+            return False
+        return not pygame.display.get_active() or not pygame.key.get_focused()
 
     @property
     def fps(self):
         return self.clock.get_fps()
-    
 
-    
+async def _forward(coroutine, future : Future):
+    if not future.set_running_or_notify_cancel():
+        coroutine.close()
+        return
+    try:
+        future.set_result(await coroutine)
+    except Exception as error:
+        future.set_exception(error)
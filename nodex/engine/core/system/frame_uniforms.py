@@ -0,0 +1,35 @@
+import struct
+import moderngl
+
+# uniform block binding point of the Frame block
+BINDING = 0
+# std140 layout of the block, all scalars: camera x, y, z, angle, horizon height, time, then the resolution
+LAYOUT = struct.Struct("8f")
+
+class FrameUniforms:
+    def __init__(self, gl_ctx : moderngl.Context):
+        """
+        The uniforms shared by the programs, the 3D camera, the time and the internal
+        resolution, kept in one uniform buffer bound to the Frame block of every program
+        declaring it, instead of being set on each of them.
+        The buffer is only written when a value changed.
+        """
+        self.gl_ctx = gl_ctx
+        self.buffer = gl_ctx.buffer(reserve = LAYOUT.size, dynamic = True)
+        self.buffer.bind_to_uniform_block(BINDING)
+        self._data = None
+
+    def attach(self, program : moderngl.Program):
+        if "Frame" in program:
+            program["Frame"].binding = BINDING
+
+    def update(self, camera, time, resolution) -> bool:
+        data = LAYOUT.pack(
+            camera.position.x, camera.position.y, camera.position.z, camera.rotation,
+            camera.horizon_height, time, *resolution
+        )
+        if data == self._data:
+            return False
+        self.buffer.write(data)
+        self._data = data
+        return True
\ No newline at end of file
@@ -1,16 +1,34 @@
+import pygame
 import moderngl
 import nodex
 
+from .gpu_timer import GpuTimer
+from .uploader import TextureUploader
+from .frame_uniforms import FrameUniforms
+from .program_cache import ProgramCache
+
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..context import Context
+
+DEFAULT_BLEND = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
+# blending into a transparent target, its alpha accumulates instead of being multiplied
+LAYER_BLEND = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA, moderngl.ONE, moderngl.ONE_MINUS_SRC_ALPHA
+PREMULTIPLIED_BLEND = moderngl.ONE, moderngl.ONE_MINUS_SRC_ALPHA
     
 class GlContext:
     def __init__(self, context : "Context"):
         self.context = context 
-        self.gl_ctx = moderngl.create_context()
+        if self.context.headless:
+            self.gl_ctx = self._create_standalone_context()
+            self.screen_fbo = self.gl_ctx.framebuffer(
+                color_attachments=[self.gl_ctx.texture(self.context.window.screen.get_size(), 4)]
+            )
+        else:
+            self.gl_ctx = moderngl.create_context()
+            self.screen_fbo = self.gl_ctx.screen
         self.gl_ctx.enable(moderngl.BLEND)
-        self.gl_ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
+        self.set_blend(DEFAULT_BLEND)
         self.render_tex = self.gl_ctx.texture(self.context.window.internal_size, 4)
         self.render_tex.filter = (moderngl.NEAREST, moderngl.NEAREST)
         self.render_fbo = self.gl_ctx.framebuffer(color_attachments=[self.render_tex])
@@ -22,16 +40,107 @@ class GlContext:
         self.pp_fbo_b = self.gl_ctx.framebuffer(color_attachments=[self.pp_tex_b])
         self.pp_library = {}   
         self.post_process = set()
+        # draw calls, uploads... of the frames, per viewport
+        self.stats = nodex.RenderStats()
+        self.gpu_timer = GpuTimer(context, self.gl_ctx)
+        self.uploader = TextureUploader(context, self.gl_ctx)
+        # camera, time and resolution, shared by the programs
+        self.frame_uniforms = FrameUniforms(self.gl_ctx)
+        # compiled programs, per shader sources
+        self.programs = ProgramCache(self.gl_ctx)
+        # texture bound to each unit, they're only bound again when it changes
+        self._bound = {}
+        # scale of the offscreen target used by the scaled layers (the Mode 7 ground)
+        self.render_scale = 1
+        self.scaled_tex = None
+        self.scaled_fbo = None
+
+    def _create_standalone_context(self):
+        # the default backend needs a display server, EGL also works on bare CI machines
+        # (with Mesa's llvmpipe software rasteriser when there is no GPU)
+        try:
+            return moderngl.create_standalone_context()
+        except Exception:
+            return moderngl.create_standalone_context(backend="egl")
 
     def init_shader_pass(self):
         self.blit_pass = nodex.ShaderPass(self.context)
         self.blit_pass.textures["tex"] = (self.render_tex, 0)
+        self.composite_pass = nodex.ShaderPass(self.context)
+
+    def set_render_scale(self, scale):
+        if scale == self.render_scale:
+            return
+        self.render_scale = scale
+        if self.scaled_tex is not None:
+            self.scaled_fbo.release()
+            self.scaled_tex.release()
+            self.scaled_tex = self.scaled_fbo = None
+        if scale == 1:
+            return
+        W, H = self.context.window.internal_size
+        self.scaled_tex = self.gl_ctx.texture((max(1, round(W * scale)), max(1, round(H * scale))), 4)
+        # linear averages the supersampled texels, nearest keeps the pixels sharp when upscaling
+        filter = moderngl.LINEAR if scale > 1 else moderngl.NEAREST
+        self.scaled_tex.filter = (filter, filter)
+        self.scaled_fbo = self.gl_ctx.framebuffer(color_attachments=[self.scaled_tex])
+        self.composite_pass.textures["tex"] = (self.scaled_tex, 0)
+
+    def begin_scaled(self):
+        """
+        Redirects the rendering into the scaled target, the layer is accumulated with
+        premultiplied alpha so it can be composited over the native one in end_scaled.
+        """
+        if self.render_scale == 1:
+            return
+        self.scaled_fbo.use()
+        self.gl_ctx.viewport = (0, 0, *self.scaled_tex.size)
+        self.gl_ctx.clear(0, 0, 0, 0)
+        self.set_blend(LAYER_BLEND)
+
+    def end_scaled(self):
+        if self.render_scale == 1:
+            return
+        self.render_fbo.use()
+        self.gl_ctx.viewport = (0, 0, *self.context.window.internal_size)
+        self.set_blend(PREMULTIPLIED_BLEND)
+        self.composite_pass.set_viewport(0, 0, *self.context.window.internal_size)
+        self.composite_pass.render()
+        self.set_blend(DEFAULT_BLEND)
+
+    def write_texture(self, tex, surf, rect = None):
+        """
+        Writes the rect of the surface (all of it by default) at the same place in the texture,
+        without converting it when the uploader can read it as it is.
+        """
+        if self.uploader.write(tex, surf, rect):
+            return
+        if rect is not None:
+            surf = surf.subsurface(rect)
+        data = pygame.image.tobytes(surf, "RGBA", True)
+        self.stats.count("upload_bytes", len(data))
+        if rect is None:
+            tex.write(data)
+        else:
+            # the texture rows are flipped
+            tex.write(data, viewport=(rect.x, tex.height - rect.bottom, rect.w, rect.h))
+
+    def use_texture(self, texture, unit = 0):
+        # moderngl writes and creates textures on its own unit, these bindings stay valid
+        if self._bound.get(unit) is not texture:
+            texture.use(unit)
+            self._bound[unit] = texture
+
+    def set_blend(self, blend_func):
+        # kept, moderngl can't read it back
+        self.blend_func = blend_func
+        self.gl_ctx.blend_func = blend_func
 
     def register_effect(self, name, frag):
         self.pp_library[name] = nodex.ShaderPass(self.context, frag)
 
     def apply_post_process(self):
-        active = [self.pp_library[n] for n in self.post_process if n in self.pp_library]
+        active = [(n, self.pp_library[n]) for n in self.post_process if n in self.pp_library]
         if not active:
             self.blit_pass.textures["tex"] = (self.render_tex, 0)
             return
@@ -40,7 +149,8 @@ class GlContext:
         texs = [self.pp_tex_a, self.pp_tex_b]
 
         src_tex = self.render_tex
-        for i, shader_pass in enumerate(active):
+        for i, (name, shader_pass) in enumerate(active):
+            self.stats.scope = f"post_process.{name}"
             dst_fbo = fbos[i % 2]
             dst_fbo.use()
             self.gl_ctx.clear(0, 0, 0)
@@ -51,14 +161,18 @@ class GlContext:
         self.blit_pass.textures["tex"] = (src_tex, 0)
 
     def after_rendering(self):
+        self.stats.scope = "post_process"
         self.apply_post_process()
-        self.gl_ctx.screen.use()
+        self.context.profiler.lap("post_process")
+        self.stats.scope = "blit"
+        self.screen_fbo.use()
         W, H = self.context.window.screen.get_size()
         self.gl_ctx.viewport = (0, 0, W, H)
         self.gl_ctx.clear(0, 0, 0)
         if self.context.window.fullscreen:
             self.gl_ctx.viewport = self.context.window.fullscreen_viewport()
         self.blit_pass.render()
+        self.context.profiler.lap("blit")
 
     def set_uniform(self, name, uniform, value):
         if name in self.pp_library:
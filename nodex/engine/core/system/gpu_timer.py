@@ -0,0 +1,59 @@
+import moderngl
+
+from collections import deque
+from contextlib import nullcontext
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..context import Context
+
+_NOT_MEASURED = nullcontext()
+
+class GpuTimer:
+    def __init__(self, context : "Context", gl_ctx : moderngl.Context, latency = 2, enabled = False):
+        """
+        Measures the GPU time of the draw calls with timer queries, labelled after
+        the render stats scope ("gpu.renderer.mode7", "gpu.post_process.blur"...).
+        The queries of a frame are read back latency frames later, when the GPU is
+        done with them, so reading doesn't stall the pipeline. The results are added
+        to the profiler of that later frame, outside of its frame time, and their sum
+        kept as frame_time (the dynamic resolution compares it to the frame budget).
+        Timer queries don't nest, only the innermost draw calls are measured.
+        """
+        self.context = context
+        self.gl_ctx = gl_ctx
+        self.latency = latency
+        self.enabled = enabled
+        # GPU time of the last frame read back, in seconds
+        self.frame_time = 0
+        self._frames = deque()
+        self._current = []
+        self._free = []
+
+    def measure(self, label):
+        """
+        Context manager measuring the draw calls made inside it.
+        """
+        if not self.enabled:
+            return _NOT_MEASURED
+        query = self._free.pop() if self._free else self.gl_ctx.query(time=True)
+        self._current.append((label, query))
+        return query
+
+    def end_frame(self):
+        if self._current:
+            self._frames.append(self._current)
+            self._current = []
+        while len(self._frames) > self.latency or (self._frames and not self.enabled):
+            self._read(self._frames.popleft())
+
+    def _read(self, queries):
+        profiler = self.context.profiler
+        frame_time = 0
+        for label, query in queries:
+            # elapsed is in nanoseconds
+            elapsed = query.elapsed / 1e9
+            profiler.add(f"gpu.{label}", elapsed, in_frame = False)
+            frame_time += elapsed
+            self._free.append(query)
+        self.frame_time = frame_time
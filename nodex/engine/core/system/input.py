@@ -1,5 +1,7 @@
 import pygame 
 
+from .replay import InputFrame
+
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..context import Context
@@ -10,6 +12,7 @@ class Input:
         self.context = context 
         self.reset_mouse_pressed()
         self._handle_keyboard()
+        self._handle_mouse()
 
     
     def reset_mouse_pressed(self):
@@ -20,6 +23,35 @@ class Input:
         self._pressed_keys = pygame.key.get_just_pressed()
         self._released_keys = pygame.key.get_just_released() 
 
+    def _handle_mouse(self):
+        self._mouse_position = pygame.mouse.get_pos()
+        self._mouse_clicked = pygame.mouse.get_pressed()
+
+    def _consume(self):
+        no_keys = pygame.key.ScancodeWrapper((False,) * len(self._pressed_keys))
+        self._pressed_keys = no_keys
+        self._released_keys = no_keys
+        self.reset_mouse_pressed()
+
+    def snapshot(self, dt) -> InputFrame:
+        return InputFrame(
+            dt,
+            self._active_keys,
+            self._pressed_keys,
+            self._released_keys,
+            self._mouse_position,
+            self._mouse_clicked,
+            list(self._mouse_pressed)
+        )
+
+    def apply(self, frame : InputFrame):
+        self._active_keys = frame.active_keys
+        self._pressed_keys = frame.pressed_keys
+        self._released_keys = frame.released_keys
+        self._mouse_position = frame.mouse_position
+        self._mouse_clicked = frame.mouse_clicked
+        self._mouse_pressed = list(frame.mouse_pressed)
+
     @property 
     def active_keys(self):
         return self._active_keys 
@@ -44,11 +76,11 @@ class Input:
         
     @property
     def scaled_mouse_position(self):
-        return pygame.mouse.get_pos()
+        return self._mouse_position
 
     @property
     def mouse_clicked(self):
-        return pygame.mouse.get_pressed()
+        return self._mouse_clicked
     
     @property
     def mouse_pressed(self):
@@ -0,0 +1,41 @@
+import time
+import moderngl
+
+class ProgramCache:
+    def __init__(self, gl_ctx : moderngl.Context):
+        """
+        Compiled programs, shared by the passes using the same shader sources.
+        What was sent to a program (its uniform handles and values) is kept per program,
+        the passes sharing one keep their own uniform values and send the ones differing.
+        """
+        self.gl_ctx = gl_ctx
+        self._programs = {}
+        self._states = {}
+        self.hits = 0
+        self.misses = 0
+        # seconds spent compiling
+        self.compile_time = 0
+
+    def __len__(self):
+        return len(self._programs)
+
+    def get(self, vertex_shader : str, fragment_shader : str) -> moderngl.Program:
+        # keyed by the sources themselves, the dict hashes them
+        key = (vertex_shader, fragment_shader)
+        program = self._programs.get(key)
+        if program is not None:
+            self.hits += 1
+            return program
+        start = time.perf_counter()
+        program = self._programs[key] = self.gl_ctx.program(vertex_shader = vertex_shader, fragment_shader = fragment_shader)
+        self.compile_time += time.perf_counter() - start
+        self.misses += 1
+        return program
+
+    def state(self, program : moderngl.Program) -> tuple[dict, dict]:
+        """
+        The uniform handles of the program, and the values last sent to them.
+        """
+        if program not in self._states:
+            self._states[program] = ({}, {})
+        return self._states[program]
\ No newline at end of file
@@ -0,0 +1,97 @@
+import gzip
+import random
+import struct
+import pygame
+import numpy as np
+
+from dataclasses import dataclass
+
+MAGIC = b"NDXR"
+VERSION = 1
+HEADER = struct.Struct("<4sBIH")
+# dt, scaled mouse position, mouse buttons bitmask
+FRAME = struct.Struct("<dhhB")
+
+@dataclass(slots=True)
+class InputFrame:
+    dt: float
+    active_keys: pygame.key.ScancodeWrapper
+    pressed_keys: pygame.key.ScancodeWrapper
+    released_keys: pygame.key.ScancodeWrapper
+    mouse_position: tuple
+    mouse_clicked: tuple
+    mouse_pressed: list
+
+def _pack_keys(keys) -> bytes:
+    # ScancodeWrapper refuses iteration, the underlying tuple is indexed by scancode
+    return np.packbits(np.array(tuple.__getitem__(keys, slice(None)), dtype=bool)).tobytes()
+
+def _unpack_keys(data, n_keys) -> pygame.key.ScancodeWrapper:
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))[:n_keys]
+    return pygame.key.ScancodeWrapper(bits.astype(bool).tolist())
+
+def _pack_buttons(clicked, pressed) -> int:
+    bits = tuple(clicked[:3]) + tuple(pressed[:2])
+    return sum(1 << i for i, bit in enumerate(bits) if bit)
+
+def _unpack_buttons(mask) -> tuple:
+    bits = [bool(mask & (1 << i)) for i in range(5)]
+    return tuple(bits[:3]), bits[3:]
+
+class InputRecorder:
+    """
+    Writes one InputFrame per rendered frame into a gzip compressed binary file.
+    The header stores the seed given to the random module, so that the gameplay
+    randomness can be replayed too.
+    """
+    def __init__(self, path, seed = None):
+        self.path = path
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self._file = None
+        self._n_keys = None
+        random.seed(self.seed)
+
+    def write(self, frame : InputFrame):
+        if self._file is None:
+            self._n_keys = len(frame.active_keys)
+            self._file = gzip.open(self.path, "wb")
+            self._file.write(HEADER.pack(MAGIC, VERSION, self.seed, self._n_keys))
+        x, y = frame.mouse_position
+        self._file.write(FRAME.pack(
+            frame.dt, int(x), int(y), _pack_buttons(frame.mouse_clicked, frame.mouse_pressed)
+        ))
+        for keys in (frame.active_keys, frame.pressed_keys, frame.released_keys):
+            self._file.write(_pack_keys(keys))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class InputReplayer:
+    """
+    Reads back a file written by InputRecorder, one frame at a time.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = gzip.open(path, "rb")
+        magic, version, self.seed, self._n_keys = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{path}' is not a nodex input recording")
+        self._keys_size = (self._n_keys + 7) // 8
+        random.seed(self.seed)
+
+    def next_frame(self) -> InputFrame | None:
+        data = self._file.read(FRAME.size + 3 * self._keys_size)
+        if len(data) < FRAME.size + 3 * self._keys_size:
+            return None
+        dt, x, y, buttons = FRAME.unpack_from(data)
+        clicked, pressed = _unpack_buttons(buttons)
+        keys = [
+            _unpack_keys(data[FRAME.size + i * self._keys_size:FRAME.size + (i + 1) * self._keys_size], self._n_keys)
+            for i in range(3)
+        ]
+        return InputFrame(dt, *keys, (x, y), clicked, pressed)
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,117 @@
+import sys
+import pygame
+import moderngl
+import nodex
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..context import Context
+
+class TextureUploader:
+    def __init__(self, context : "Context", gl_ctx : moderngl.Context):
+        """
+        Uploads surfaces without converting them on the CPU: the rows are streamed as
+        they are in memory into an orphaned pixel buffer, then a staging texture, and
+        drawn into the destination texture by a shader flipping them, the channels being
+        reordered by the staging texture swizzle. The destination ends up like with
+        pygame.image.tobytes(surface, "RGBA", True).
+        Only 32 bits surfaces can be read as they are, and uploads larger than the
+        internal resolution (the big textures loaded once) would need a staging texture
+        as large, write returns False for both and they go through tobytes.
+        """
+        self.context = context
+        self.gl_ctx = gl_ctx
+        self._program = None
+        self._vao = None
+        self._pbo = None
+        self._staging = None
+        self._fbos = {}
+
+    def _init_gl(self):
+        self._program = self.context._gl_context.programs.get(
+            self.context.shaders.get("_upload_vertex"),
+            self.context.shaders.get("_fragment")
+        )
+        self._program["tex"] = 0
+        vbo = self.gl_ctx.buffer(nodex.make_quad(-1, -1, 1, 1).tobytes())
+        self._vao = self.gl_ctx.vertex_array(self._program, [(vbo, "2f 2f", "in_pos", "in_uv")])
+        self._pbo = self.gl_ctx.buffer(reserve = 4, dynamic = True)
+        self._staging = self.gl_ctx.texture(self.context.window.internal_size, 4)
+        self._staging.filter = (moderngl.NEAREST, moderngl.NEAREST)
+
+    def _fbo(self, texture):
+        fbo = self._fbos.get(texture)
+        if fbo is None:
+            fbo = self._fbos[texture] = self.gl_ctx.framebuffer(color_attachments = [texture])
+        return fbo
+
+    def forget(self, texture):
+        """
+        Releases what was kept for a texture about to be released.
+        """
+        fbo = self._fbos.pop(texture, None)
+        if fbo is not None:
+            fbo.release()
+
+    def write(self, texture : moderngl.Texture, surface : pygame.Surface, rect : pygame.Rect = None) -> bool:
+        """
+        Writes the rect of the surface (all of it by default) at the same place in the texture.
+        Returns False when the surface can't be read as it is.
+        """
+        swizzle = _swizzle(surface)
+        rect = rect or surface.get_rect()
+        # subsurfaces are read from their parent, its rows are the contiguous ones
+        root = surface.get_abs_parent()
+        ox, oy = surface.get_abs_offset()
+        pitch = root.get_pitch()
+        width = pitch // 4
+        if swizzle is None or width > self.context.window.internal_size[0] or rect.h > self.context.window.internal_size[1]:
+            return False
+        if self._program is None:
+            self._init_gl()
+
+        # whole rows, from the first of the rect to its last
+        start = (oy + rect.y) * pitch
+        size = rect.h * pitch
+        stats = self.context._gl_context.stats
+        with memoryview(root.get_buffer()) as data:
+            self._pbo.orphan(size)
+            self._pbo.write(data[start:start + size])
+        stats.count("upload_bytes", size)
+        self._staging.write(self._pbo, viewport = (0, 0, width, rect.h))
+        self._staging.swizzle = swizzle
+
+        W, H = self._staging.size
+        self._program["source"] = ((ox + rect.x) / W, 0, rect.w / W, rect.h / H)
+        previous_fbo = self.gl_ctx.fbo
+        fbo = self._fbo(texture)
+        fbo.use()
+        # the texture rows are bottom up
+        self.gl_ctx.viewport = (rect.x, texture.height - rect.bottom, rect.w, rect.h)
+        # copied as is, alpha included
+        self.gl_ctx.disable(moderngl.BLEND)
+        self.context._gl_context.use_texture(self._staging, 0)
+        self._vao.render()
+        self.gl_ctx.enable(moderngl.BLEND)
+        stats.count("draw_calls")
+        # none bound yet when uploading before the first frame
+        if previous_fbo is not None:
+            previous_fbo.use()
+        return True
+
+def _swizzle(surface : pygame.Surface):
+    """
+    The staging texture swizzle reading the surface pixels in RGBA, None if they aren't 32 bits.
+    """
+    if surface.get_bytesize() != 4:
+        return None
+    # the byte holding each channel, the masks are for the pixels read as integers
+    components = ["1"] * 4
+    for i, (mask, shift) in enumerate(zip(surface.get_masks(), surface.get_shifts())):
+        if mask == 0:
+            continue
+        if mask != 0xff << shift or shift % 8:
+            return None
+        byte = shift // 8 if sys.byteorder == "little" else 3 - shift // 8
+        components[i] = "RGBA"[byte]
+    return "".join(components)
\ No newline at end of file
@@ -18,6 +18,11 @@ class Window:
         self.fullscreen = False
     
     def toggle_fullscreen(self) -> None:
+        if self.context.headless:
+            return
+        if self.context.runtime.in_simulation:
+            self.context.runtime.call_on_main(self.toggle_fullscreen)
+            return
         if self.fullscreen:
             self.screen = self.create_screen(self._window_scale, self._vsync)     
         else:
@@ -26,6 +31,13 @@ class Window:
   
     def create_screen(self, scale:int = 1, vsync:bool = False) -> pygame.Surface:
        
+        if self.context.headless:
+            # the dummy video driver can't create a GL window, the surface only 
+            # exists so that convert_alpha and friends keep working
+            self.offset = (0, 0)
+            return pygame.display.set_mode(
+                (self.internal_size[0] * scale, self.internal_size[1] * scale)
+            )
         if scale:
             self.offset = (0, 0)
             return pygame.display.set_mode(
@@ -73,6 +85,17 @@ class Window:
     def internal_size(self) -> tuple:
         return self._internal_size
     
+    @property
+    def vsync(self) -> bool:
+        return self._vsync and not self.context.headless
+
+    @property
+    def refresh_rate(self) -> int:
+        """
+        Refresh rate of the display the window is on, 0 when unknown.
+        """
+        return pygame.display.get_current_refresh_rate()
+
     @property 
     def window_scale(self):
         if self.fullscreen:
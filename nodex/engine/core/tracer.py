@@ -0,0 +1,108 @@
+import os
+import json
+import time
+import threading
+import functools
+
+from collections import deque
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .context import Context
+
+# spans kept at most, the oldest ones are dropped past that
+MAX_SPANS = 1_000_000
+
+class Tracer:
+    def __init__(self, context : "Context", path = None):
+        """
+        Records nested timing spans of the game nodes, scenes, viewports and passes,
+        exported in the Chrome trace event format (chrome://tracing, ui.perfetto.dev).
+        Enabling it wraps the traced methods on their classes, disabling it puts the
+        original ones back, so a disabled tracer costs nothing.
+        When a path is given, the trace is written there on quit.
+        """
+        self.context = context
+        self.path = path
+        self.enabled = False
+        self.spans = deque(maxlen = MAX_SPANS)
+        self._originals = []
+        self._start = time.perf_counter()
+
+    def _targets(self):
+        from ..world.game_node import GameNode
+        from ..world.scene import Scene
+        from ..rendering.pipeline.viewport import Viewport
+        from ..rendering.passes import ShaderPass, PygamePass, WorldPass, Mode7Pass, BillboardPass, SpritePass
+        from .runtime import Runtime
+
+        scene_name = lambda scene: next(
+            (name for name, other in self.context.scenes.scenes.items() if other is scene), "persistant"
+        )
+        targets = [
+            (Runtime, "_update_and_render", "frame", lambda runtime: ("frame", None)),
+            (Runtime, "tick", "frame", lambda runtime: ("tick", None)),
+            (Scene, "update", "scene", lambda scene: ("Scene.update", {"scene": scene_name(scene)})),
+            (GameNode, "update_all", "node", lambda node: (type(node).__name__, {"id": node.id})),
+            (Viewport, "render", "render", lambda viewport: ("Viewport.render", {"viewport": viewport.name})),
+        ]
+        for cls in (ShaderPass, PygamePass, WorldPass, Mode7Pass, BillboardPass, SpritePass):
+            targets.append((cls, "render", "render", lambda _, name=f"{cls.__name__}.render": (name, None)))
+        return targets
+
+    def _wrap(self, method, category, describe):
+        spans = self.spans
+
+        @functools.wraps(method)
+        def traced(obj, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(obj, *args, **kwargs)
+            finally:
+                spans.append((describe(obj), category, start, time.perf_counter(), threading.get_ident()))
+        return traced
+
+    def enable(self):
+        if self.enabled:
+            return
+        for cls, name, category, describe in self._targets():
+            method = cls.__dict__[name]
+            self._originals.append((cls, name, method))
+            setattr(cls, name, self._wrap(method, category, describe))
+        self.enabled = True
+
+    def disable(self):
+        for cls, name, method in reversed(self._originals):
+            setattr(cls, name, method)
+        self._originals.clear()
+        self.enabled = False
+
+    def clear(self):
+        self.spans.clear()
+
+    def events(self) -> list[dict]:
+        threads = {thread.ident: thread.name for thread in threading.enumerate()}
+        pid = os.getpid()
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        for (name, args), category, start, end, tid in self.spans:
+            event = {
+                "name": name, "cat": category, "ph": "X", "pid": pid, "tid": tid,
+                # microseconds since the tracer was created
+                "ts": (start - self._start) * 1e6, "dur": (end - start) * 1e6,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        return events
+
+    def export(self, path = None):
+        with open(path or self.path, "w") as f:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, f)
+
+    def close(self):
+        if self.spans and self.path:
+            self.export()
+        self.disable()
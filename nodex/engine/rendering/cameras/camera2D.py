@@ -8,3 +8,11 @@ class Camera2D:
         self.rotation:float = 0
         self.zoom:float = 1
 
+    def copy(self) -> "Camera2D":
+        camera = Camera2D()
+        camera.position = pygame.Vector2(self.position)
+        camera.offset = pygame.Vector2(self.offset)
+        camera.rotation = self.rotation
+        camera.zoom = self.zoom
+        return camera
+
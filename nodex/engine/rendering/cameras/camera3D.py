@@ -1,9 +1,48 @@
+import math
 import pygame
 
 class Camera3D:
     def __init__(self):
-        self.position:pygame.Vector3 = pygame.Vector3(0, 0, 0) 
+        self.position:pygame.Vector3 = pygame.Vector3(0, 0, 0)
         self.rotation:float = 0
         self.horizon_height:float = 0.5
         self.offset:int = pygame.Vector2()
+        self._previous = None
+        self._interpolated = None
 
+    def store(self):
+        """
+        Keeps the current state as the previous tick one, used by interpolated.
+        """
+        self._previous = (pygame.Vector3(self.position), self.rotation, self.horizon_height)
+        self._interpolated = None
+
+    def copy(self) -> "Camera3D":
+        """
+        Returns a copy holding the same state, the previous tick one included.
+        """
+        camera = Camera3D()
+        camera.position = pygame.Vector3(self.position)
+        camera.rotation = self.rotation
+        camera.horizon_height = self.horizon_height
+        camera.offset = pygame.Vector2(self.offset)
+        camera._previous = self._previous
+        return camera
+
+    def interpolated(self, alpha:float) -> "Camera3D":
+        """
+        Returns a camera blended between the previous tick and the current one.
+        """
+        if alpha >= 1 or self._previous is None:
+            return self
+        if self._interpolated is not None and self._interpolated[0] == alpha:
+            return self._interpolated[1]
+        position, rotation, horizon_height = self._previous
+        camera = Camera3D()
+        camera.position = position.lerp(self.position, alpha)
+        # along the shortest arc, the angles may have been wrapped between the ticks
+        camera.rotation = rotation + ((self.rotation - rotation + math.pi) % math.tau - math.pi) * alpha
+        camera.horizon_height = horizon_height + (self.horizon_height - horizon_height) * alpha
+        camera.offset = self.offset
+        self._interpolated = (alpha, camera)
+        return camera
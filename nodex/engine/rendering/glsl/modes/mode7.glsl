@@ -7,17 +7,20 @@ uniform sampler2D tex;
 uniform sampler2D infinite;
 uniform sampler2D extra;
 
-uniform float camera_x;
-uniform float camera_y;
-uniform float camera_z;
-uniform float camera_angle;
-uniform float horizon_height;
+// shared by the programs, written once per frame
+layout(std140) uniform Frame {
+    float camera_x;
+    float camera_y;
+    float camera_z;
+    float camera_angle;
+    float horizon_height;
+    float time;
+    vec2 resolution;
+};
 
 uniform vec2 tex_scale;
 uniform vec2 tex_offset;
 
-uniform float time;
-
 const float REFLECTION_SPEED = 0.5;
 const float FOG_START = 30.0;
 const float FOG_END = 150.0;
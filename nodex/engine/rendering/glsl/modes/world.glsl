@@ -5,6 +5,8 @@ out vec2 uv;
 
 uniform float rotation;
 uniform float zoom;
+// left, bottom, right, top of the drawn rect, in NDC, the quad is static
+uniform vec4 quad;
 
 void main() {
     vec2 centered = in_uv - 0.5;
@@ -19,5 +21,5 @@ void main() {
 
     uv = (rotated / zoom) + 0.5;
 
-    gl_Position = vec4(in_pos, 0.0, 1.0);
+    gl_Position = vec4(mix(quad.xy, quad.zw, in_pos * 0.5 + 0.5), 0.0, 1.0);
 }
\ No newline at end of file
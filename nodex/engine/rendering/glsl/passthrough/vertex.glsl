@@ -2,7 +2,9 @@
 in vec2 in_pos;
 in vec2 in_uv;
 out vec2 uv;
+// left, bottom, right, top of the drawn rect, in NDC, the quad is static
+uniform vec4 quad;
 void main() {
     uv = in_uv;
-    gl_Position = vec4(in_pos, 0.0, 1.0);
+    gl_Position = vec4(mix(quad.xy, quad.zw, in_pos * 0.5 + 0.5), 0.0, 1.0);
 }
\ No newline at end of file
@@ -0,0 +1,6 @@
+#version 330
+in vec4 color;
+out vec4 fragColor;
+void main() {
+    fragColor = color;
+}
\ No newline at end of file
@@ -0,0 +1,16 @@
+#version 330
+in vec2 in_pos;
+in vec4 in_color;
+out vec4 color;
+
+// target size in pixels
+uniform vec2 size;
+// pixels to target pixels, to follow the camera of the pass
+uniform vec2 scale;
+uniform vec2 offset;
+
+void main() {
+    color = in_color / 255.0;
+    vec2 pos = in_pos * scale + offset;
+    gl_Position = vec4(pos.x / size.x * 2.0 - 1.0, 1.0 - pos.y / size.y * 2.0, 0.0, 1.0);
+}
\ No newline at end of file
@@ -0,0 +1,8 @@
+#version 330
+in vec2 uv;
+in vec4 tint;
+out vec4 fragColor;
+uniform sampler2D tex;
+void main() {
+    fragColor = texture(tex, uv) * tint;
+}
\ No newline at end of file
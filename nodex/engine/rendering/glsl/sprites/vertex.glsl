@@ -0,0 +1,24 @@
+#version 330
+// corner of the quad, 0 to 1
+in vec2 in_corner;
+// per sprite: x, y, width, height in pixels
+in vec4 in_rect;
+// per sprite: u, v, width, height of the sprite in its texture
+in vec4 in_source;
+in vec4 in_tint;
+in float in_angle;
+out vec2 uv;
+out vec4 tint;
+
+uniform vec2 size;
+
+void main() {
+    uv = in_source.xy + in_corner * in_source.zw;
+    tint = in_tint / 255.0;
+    // rotated around the sprite center, counterclockwise on screen
+    vec2 local = (in_corner - 0.5) * in_rect.zw;
+    float c = cos(in_angle);
+    float s = sin(in_angle);
+    vec2 pos = in_rect.xy + in_rect.zw * 0.5 + vec2(local.x * c + local.y * s, local.y * c - local.x * s);
+    gl_Position = vec4(pos.x / size.x * 2.0 - 1.0, 1.0 - pos.y / size.y * 2.0, 0.0, 1.0);
+}
\ No newline at end of file
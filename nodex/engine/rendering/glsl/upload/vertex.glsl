@@ -0,0 +1,12 @@
+#version 330
+in vec2 in_pos;
+in vec2 in_uv;
+out vec2 uv;
+
+// x, y, width, height of the rows to copy in the staging texture, top down
+uniform vec4 source;
+
+void main() {
+    uv = vec2(source.x + in_uv.x * source.z, source.y + (1.0 - in_uv.y) * source.w);
+    gl_Position = vec4(in_pos, 0.0, 1.0);
+}
\ No newline at end of file
@@ -1,5 +1,7 @@
+from .primitive_batch import PrimitiveBatch
 from .shader_pass import ShaderPass 
 from .world_pass import WorldPass 
 from .pygame_pass import PygamePass
 from .mode7_pass import Mode7Pass
-from .billboard import BillboardPass
\ No newline at end of file
+from .billboard import BillboardPass
+from .sprite_pass import SpritePass
\ No newline at end of file
@@ -44,19 +44,24 @@ class BillboardPass(WorldPass):
     def _get_scaled(self, name, scale):
         quantized = self._quantize(scale) 
         key = (name, quantized)
+        stats = self.context._gl_context.stats
         if key not in self._cache:
             surface = self.context.assets.get_image(name)
             w, h = surface.get_size()
             self._cache[key] = pygame.transform.scale(
                 surface, (max(1, int(w * quantized)), max(1, int(h * quantized)))
             )
+            stats.count("cache_misses")
+            stats.count("scales")
+        else:
+            stats.count("cache_hits")
         return self._cache[key] 
     
     def draw(self, element, world_pos, angle = 0, anchor = (0.5, 1.0)):
         if len(world_pos) == 2:
             self.draw_tasks.append({"position" : world_pos, "surface" : element, "z" : float('inf')})
 
-        camera = self.context.renderer.camera3D(self.settings["reference"])
+        camera = self.context.renderer.camera3D(self.settings["reference"], rendered=True).interpolated(self.context.alpha)
 
         screen_pos, scale = nodex.world_to_screen((
             world_pos[0], world_pos[1], -world_pos[2]
@@ -68,6 +73,7 @@ class BillboardPass(WorldPass):
         if isinstance(element, pygame.Surface):
             w, h = element.get_size()
             scaled = pygame.transform.scale(element, (max(1, int(w * scale)), max(1, int(h * scale))))
+            self.context._gl_context.stats.count("scales")
         else:
             name = self._resolve_name(element, camera, world_pos, angle)
             scaled = self._get_scaled(name, scale)
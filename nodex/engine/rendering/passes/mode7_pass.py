@@ -23,18 +23,23 @@ class Mode7Pass:
         self.context = context
 
         self.camera = nodex.Camera3D()
+        # the camera of the last published tick, the one used for rendering
+        self.render_camera = self.camera
         # static texture shader pass 
         self.static_pass = ShaderPass(self.context, self.context.shaders.get("_mode7")) 
-        # we load it's texture from the settings
-        self.static_pass.load_texture(settings["texture_name"], settings["texture"])
-        print(settings["infinite"])
-        self.static_pass.load_texture("infinite", settings["infinite"])
-        self.static_pass.load_texture("extra", settings["extra"])
+        # we load it's texture from the settings (asset names or paths), the big ground textures 
+        # are decoded in the background, the layer isn't rendered before they are uploaded.
+        # the two passes share the textures they both use
+        self.static_pass.bind_texture(settings["texture_name"], settings["texture"])
+        self.static_pass.bind_texture("infinite", settings["infinite"])
+        self.static_pass.bind_texture("extra", settings["extra"])
         
         # dynamic texture shader pass
         self.dynamic_pass = WorldPass(self.context, self.context.shaders.get("_mode7"))
-        self.dynamic_pass.load_texture("infinite", settings["infinite"])
-        self.dynamic_pass.load_texture("extra", settings["extra"])
+        self.dynamic_pass.bind_texture("infinite", settings["infinite"])
+        self.dynamic_pass.bind_texture("extra", settings["extra"])
+        # flipped like the surfaces drawn into it
+        self.dynamic_pass.primitives.flip = True
  
         self.camera.position.z = 0.1
         self.camera.position.x = 0.5
@@ -43,6 +48,17 @@ class Mode7Pass:
 
         self.scenes = settings["scenes"]
 
+    @property
+    def primitives(self):
+        return self.dynamic_pass.primitives
+
+    @property
+    def ready(self):
+        """
+        Whether the queued textures are uploaded.
+        """
+        return len(self.static_pass.textures) == 3 and len(self.dynamic_pass.textures) == 3
+
     @property
     def static_size(self):
         """
@@ -72,11 +88,17 @@ class Mode7Pass:
         self.dynamic_pass.draw(surface, (position[0], flipped_y))
 
     def dynamic_follow(self, position):
+        if not self.ready:
+            return
         self.dynamic_pass.camera.position.x = self.camera.offset.x * self.scale[0] * self.dynamic_size[0]
         self.dynamic_pass.camera.position.y = -self.camera.offset.y * self.scale[1] * self.dynamic_size[1]
         self.camera.offset.x = position[0] - 0.5 / self.scale[0]
         self.camera.offset.y = position[1] - 0.5 / self.scale[1]
 
+    def publish(self):
+        self.render_camera = self.camera.copy()
+        self.dynamic_pass.publish()
+
     def set_scale(self):
         """
         Set the uniforms relative to the texture scales.
@@ -94,25 +116,24 @@ class Mode7Pass:
         self.static_pass.set_uniform("tex_offset", (0, 0))
         # the dynamic texture, yes
         self.dynamic_pass.set_uniform("tex_offset", (
-            self.camera.offset.x, 
-            self.camera.offset.y 
+            self.render_camera.offset.x, 
+            self.render_camera.offset.y 
         ))
       
     def set_uniforms(self):
-        for _pass in (self.static_pass, self.dynamic_pass):
-            _pass.set_uniform("camera_x", self.camera.position.x)
-            _pass.set_uniform("camera_y", self.camera.position.y)
-            _pass.set_uniform("camera_z", self.camera.position.z)    
-            _pass.set_uniform("camera_angle", self.camera.rotation)   
-            _pass.set_uniform("horizon_height", self.camera.horizon_height)
-            _pass.set_uniform("time", self.context.timer)
+        camera = self.render_camera.interpolated(self.context.alpha)
+        # in the uniform block the two programs share
+        self.context._gl_context.frame_uniforms.update(camera, self.context.timer, self.context.window.internal_size)
         self.set_offset()
         self.set_scale()
        
     def render(self):
-        if self.context.scenes.current_scene in self.scenes:
+        if self.ready and self.context.scenes.current_scene in self.scenes:
             self.set_uniforms()
             # we force the static viewport to fit the screen, because the static texture is huge in size
             self.static_pass.set_viewport(0, 0, *self.context.window.internal_size)
+            # the ground can be rendered above or below the native resolution
+            self.context._gl_context.begin_scaled()
             self.static_pass.render()
-            self.dynamic_pass.render()
\ No newline at end of file
+            self.dynamic_pass.render()
+            self.context._gl_context.end_scaled()
\ No newline at end of file
@@ -0,0 +1,157 @@
+import math
+import pygame
+import moderngl
+import nodex
+
+from array import array
+
+from ..pipeline.draw_task import Circle, Line
+from ...core.system.gl_context import LAYER_BLEND
+
+# circles are split into segments of about this length, in pixels
+SEGMENT_LENGTH = 2
+MIN_SEGMENTS = 8
+# floats per vertex: position, color
+VERTEX_SIZE = 6
+
+class PrimitiveBatch:
+    def __init__(self, context : "nodex.Context"):
+        """
+        Rects, circles and lines drawn in a viewport, collected into one vertex buffer
+        and drawn in a single call with a flat colour shader, no surface is filled for them.
+        Positions are in pixels, moved by offset and flipped vertically when flip is set,
+        so the primitives follow the camera of the pass they're drawn into.
+        The GL objects are created on the first render, most passes never draw any.
+        """
+        self.context = context
+        self.offset = (0, 0)
+        self.flip = False
+        self._vertices = array("f")
+        self._program = None
+        self._vbo = None
+        self._vao = None
+        self._target = None
+        self._fbo = None
+        self._circles = {}
+
+    def __len__(self):
+        return len(self._vertices) // VERTEX_SIZE
+
+    def add(self, task):
+        """
+        Adds the triangles of a primitive draw task.
+        """
+        ADDERS[task.content.__class__](self, task)
+
+    def _triangles(self, points, color):
+        r, g, b, *a = color
+        a = a[0] if a else 255
+        vertices = self._vertices
+        for x, y in points:
+            vertices.extend((x, y, r, g, b, a))
+
+    def add_rect(self, task):
+        x, y, w, h = task.content
+        self._triangles(((x, y), (x + w, y), (x + w, y + h), (x, y), (x + w, y + h), (x, y + h)), task.color)
+
+    def add_circle(self, task):
+        cx, cy = task.position
+        radius = task.content.radius
+        unit = self._unit_circle(max(MIN_SEGMENTS, math.ceil(math.tau * radius / SEGMENT_LENGTH)))
+        points = []
+        for (x1, y1), (x2, y2) in zip(unit, unit[1:]):
+            points += ((cx, cy), (cx + x1 * radius, cy + y1 * radius), (cx + x2 * radius, cy + y2 * radius))
+        self._triangles(points, task.color)
+
+    def add_line(self, task):
+        x1, y1 = task.position
+        dx, dy = task.content.vector
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return
+        # half the width, perpendicular to the line
+        nx, ny = -dy / length * task.content.width / 2, dx / length * task.content.width / 2
+        x2, y2 = x1 + dx, y1 + dy
+        self._triangles((
+            (x1 + nx, y1 + ny), (x2 + nx, y2 + ny), (x2 - nx, y2 - ny),
+            (x1 + nx, y1 + ny), (x2 - nx, y2 - ny), (x1 - nx, y1 - ny),
+        ), task.color)
+
+    def _unit_circle(self, segments):
+        if segments not in self._circles:
+            self._circles[segments] = [
+                (math.cos(i / segments * math.tau), math.sin(i / segments * math.tau)) for i in range(segments + 1)
+            ]
+        return self._circles[segments]
+
+    def _init_gl(self):
+        gl_ctx = self.context._gl_context.gl_ctx
+        self._program = self.context._gl_context.programs.get(
+            self.context.shaders.get("_primitive_vertex"),
+            self.context.shaders.get("_primitive_fragment")
+        )
+        self._vbo = gl_ctx.buffer(reserve = len(self._vertices) * 4, dynamic = True)
+        self._vao = gl_ctx.vertex_array(self._program, [(self._vbo, "2f 4f", "in_pos", "in_color")])
+
+    def _use_target(self, target : moderngl.Texture):
+        if target is not self._target:
+            if self._fbo is not None:
+                self._fbo.release()
+            self._fbo = self.context._gl_context.gl_ctx.framebuffer(color_attachments = [target])
+            self._target = target
+        self._fbo.use()
+
+    def render(self, target : moderngl.Texture = None):
+        """
+        Draws the primitives added since the last render and clears them, into the target
+        texture if given, else into the current framebuffer (the internal resolution).
+        Returns the pixels covered in the target, top down, None when nothing was drawn.
+        """
+        if not self._vertices:
+            return None
+        if self._program is None:
+            self._init_gl()
+        gl_context = self.context._gl_context
+        data = self._vertices.tobytes()
+        if self._vbo.size < len(data):
+            self._vbo.orphan(len(data))
+        self._vbo.write(data)
+        gl_context.stats.count("upload_bytes", len(data))
+
+        W, H = target.size if target is not None else self.context.window.internal_size
+        ox, oy = self.offset
+        self._program["size"] = (W, H)
+        self._program["scale"] = (1, -1) if self.flip else (1, 1)
+        self._program["offset"] = (ox, oy + H) if self.flip else (ox, oy)
+
+        if target is not None:
+            previous_fbo, previous_blend = gl_context.gl_ctx.fbo, gl_context.blend_func
+            self._use_target(target)
+            gl_context.set_blend(LAYER_BLEND)
+        with gl_context.gpu_timer.measure(gl_context.stats.scope):
+            self._vao.render(moderngl.TRIANGLES, vertices = len(self))
+        gl_context.stats.count("draw_calls")
+        if target is not None:
+            previous_fbo.use()
+            gl_context.set_blend(previous_blend)
+        bounds = self._bounds(W, H)
+        del self._vertices[:]
+        return bounds
+
+    def _bounds(self, W, H):
+        xs, ys = self._vertices[0::VERTEX_SIZE], self._vertices[1::VERTEX_SIZE]
+        ox, oy = self.offset
+        x1, x2 = min(xs) + ox, max(xs) + ox
+        if self.flip:
+            y1, y2 = H - max(ys) + oy, H - min(ys) + oy
+        else:
+            y1, y2 = min(ys) + oy, max(ys) + oy
+        # a pixel more, the edges are rasterized on the pixels they touch
+        left, top = math.floor(x1) - 1, math.floor(y1) - 1
+        return pygame.Rect(left, top, math.ceil(x2) + 1 - left, math.ceil(y2) + 1 - top).clip((0, 0, W, H))
+
+ADDERS = {
+    pygame.Rect: PrimitiveBatch.add_rect,
+    Circle: PrimitiveBatch.add_circle,
+    Line: PrimitiveBatch.add_line,
+}
\ No newline at end of file
@@ -6,23 +6,46 @@ class PygamePass(ShaderPass):
     """ 
     A small abstraction over ShaderPass that encapsulate an internal 
     pygame surface, automatically rendered.
+    Only the regions drawn since the last render are uploaded and cleared, along
+    with the ones drawn the frame before, still in the texture.
     """
     def __init__(self, context, frag_prog=None, vert_prog=None):
         super().__init__(context, frag_prog, vert_prog)
         self._surf = pygame.Surface(context.window.internal_size, pygame.SRCALPHA)
         self.dump_pygame_surf("tex", self._surf, slot=0)
+        # drawn since the last render
+        self._dirty = None
+        # not transparent in the texture, since the last render
+        self._uploaded = None
 
     @property
     def surface(self) -> pygame.Surface:
+        # it can be drawn into from outside, as a whole
+        self._add_dirty(self._surf.get_rect())
         return self._surf
 
+    def _add_dirty(self, rect):
+        if rect:
+            self._dirty = rect if self._dirty is None else self._dirty.union(rect)
+
     def blit(self, surface: pygame.Surface, position: tuple) -> None:
-        self._surf.blit(surface, position)
+        self._add_dirty(self._surf.blit(surface, position))
 
     def fill(self, color=(0, 0, 0, 0)) -> None:
         self._surf.fill(color)
+        self._add_dirty(self._surf.get_rect())
 
     def render(self) -> None:
-        self.dump_pygame_surf("tex", self._surf)
-        self._surf.fill((0, 0, 0, 0))
+        dirty, region = self._dirty, self._dirty
+        if self._uploaded is not None:
+            region = self._uploaded if region is None else region.union(self._uploaded)
+        if region is not None:
+            self.write_texture(self.textures["tex"][0], self._surf, region)
+        if dirty is not None:
+            self._surf.fill((0, 0, 0, 0), dirty)
+        # drawn over the surface, straight into its texture
+        drawn = self.primitives.render(self.textures["tex"][0])
+        if drawn:
+            dirty = drawn if dirty is None else dirty.union(drawn)
+        self._uploaded, self._dirty = dirty, None
         super().render()
\ No newline at end of file
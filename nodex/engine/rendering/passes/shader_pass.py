@@ -3,18 +3,34 @@ import moderngl
 import numpy as np
 import nodex
 
+from .primitive_batch import PrimitiveBatch
+
+_UNSET = object()
+
 class ShaderPass:
     def __init__(self, context : "nodex.Context", frag_prog:str = None, vert_prog:str = None):
         self.context = context
         self.textures = {}   
+        # names of the textures shared through the registry -> their key
+        self._shared = {}
+        # names of the shared textures not uploaded yet -> (their key, the callback binding them)
+        self._waiting = {}
         self.uniforms = {}   
-        self.shader_prog = context._gl_context.gl_ctx.program(
-            vertex_shader = vert_prog or self.context.shaders.get("_vertex"),
-            fragment_shader = frag_prog or self.context.shaders.get("_fragment")
+        self.shader_prog = context._gl_context.programs.get(
+            vert_prog or self.context.shaders.get("_vertex"),
+            frag_prog or self.context.shaders.get("_fragment")
         )
-        self.vbo = context._gl_context.gl_ctx.buffer(nodex.make_quad(-1, -1, 1, 1).tobytes(), dynamic=True)
+        context._gl_context.frame_uniforms.attach(self.shader_prog)
+        # uniform handles (None for the ones the program doesn't have), and the values they were sent,
+        # shared with the passes using the same program
+        self._handles, self._sent = context._gl_context.programs.state(self.shader_prog)
+        # the quad is moved by the quad uniform, when the vertex shader has it, else rewritten
+        self._static_quad = "quad" in self.shader_prog
+        self.vbo = context._gl_context.gl_ctx.buffer(nodex.make_quad(-1, -1, 1, 1).tobytes(), dynamic=not self._static_quad)
         self.vao = context._gl_context.gl_ctx.vertex_array(self.shader_prog, [(self.vbo, '2f 2f', 'in_pos', 'in_uv')])
         self.viewport = None  
+        # rects, circles and lines drawn in the pass
+        self.primitives = PrimitiveBatch(context)
 
     def next_slot(self) -> int:
         used = {slot for _, slot in self.textures.values()}
@@ -27,20 +43,25 @@ class ShaderPass:
         self.viewport = (ox, oy, sw, sh)
 
     def dump_pygame_surf(self, name: str, surf: pygame.Surface, slot: int = None, filter: int = moderngl.NEAREST) -> None:
-        data = pygame.image.tobytes(surf, "RGBA", True)
+        gl_context = self.context._gl_context
+        self.unbind_texture(name)
         if name in self.textures:
             tex, assigned_slot = self.textures[name]
             if tex.size == surf.get_size():
-                tex.write(data)
+                self.write_texture(tex, surf)
                 return
             else:
+                gl_context.uploader.forget(tex)
                 tex.release()  
-        tex = self.context._gl_context.gl_ctx.texture(surf.get_size(), 4)
+        tex = gl_context.gl_ctx.texture(surf.get_size(), 4)
         tex.filter = (filter, filter)
-        tex.write(data)
+        self.write_texture(tex, surf)
         assigned_slot = slot if slot is not None else self.next_slot()
         self.textures[name] = (tex, assigned_slot)
 
+    def write_texture(self, tex: moderngl.Texture, surf: pygame.Surface, rect: pygame.Rect = None) -> None:
+        self.context._gl_context.write_texture(tex, surf, rect)
+
     def load_texture(self, name:str, path:str, slot:int = None, filter:int = moderngl.NEAREST) -> None:
         self.dump_pygame_surf(
             name, 
@@ -49,19 +70,70 @@ class ShaderPass:
             filter
         )
 
+    def bind_texture(self, name:str, key:str, slot:int = None, filter:int = moderngl.NEAREST) -> None:
+        """
+        Samples the shared texture of an asset name or image path (see TextureRegistry)
+        as name, once it's uploaded. The image is loaded and uploaded once for all the passes.
+        """
+        def bound(texture):
+            del self._waiting[name]
+            self.unbind_texture(name)
+            self.textures[name] = (texture, slot if slot is not None else self.next_slot())
+            self._shared[name] = key
+        # the texture bound until then stays until this one is uploaded
+        self._cancel_waiting(name)
+        self._waiting[name] = (key, bound)
+        self.context.textures.acquire(key, bound, filter)
+
+    def _cancel_waiting(self, name:str) -> None:
+        if name in self._waiting:
+            key, bound = self._waiting.pop(name)
+            self.context.textures.cancel(key, bound)
+
+    def unbind_texture(self, name:str) -> None:
+        self._cancel_waiting(name)
+        if name in self._shared:
+            self.context.textures.release(self._shared.pop(name))
+            del self.textures[name]
+
     def set_uniform(self, name:str, value:int) -> None:
-        self.uniforms[name] = value
+        if name in self.uniforms:
+            self.uniforms[name] = value
+        else:
+            # a new dict, the render thread may be iterating the current one
+            self.uniforms = self.uniforms | {name: value}
+
+    def publish(self) -> None:
+        """
+        Called once the tick is over, keeps what the rendering of it needs.
+        """
+        pass
+
+    def send_uniform(self, name:str, value) -> None:
+        """
+        Sets a uniform of the program, if it has it and the value changed since it was last sent.
+        """
+        if self._sent.get(name, _UNSET) == value:
+            return
+        handle = self._handles.get(name, _UNSET)
+        if handle is _UNSET:
+            handle = self._handles[name] = self.shader_prog.get(name, None)
+        if handle is not None:
+            handle.value = value
+            self.context._gl_context.stats.count("uniforms")
+        self._sent[name] = value
 
     def render(self) -> None:
         self.update_quad()
+        gl_context = self.context._gl_context
         for name, (tex, slot) in self.textures.items():
-            tex.use(slot)
-            if name in self.shader_prog:
-                self.shader_prog[name] = slot
+            gl_context.use_texture(tex, slot)
+            self.send_uniform(name, slot)
         for name, value in self.uniforms.items():
-            if name in self.shader_prog:
-                self.shader_prog[name] = value
-        self.vao.render()
+            self.send_uniform(name, value)
+        with gl_context.gpu_timer.measure(gl_context.stats.scope):
+            self.vao.render()
+        gl_context.stats.count("draw_calls")
         self.viewport = None 
 
     def update_quad(self) -> None:
@@ -74,9 +146,10 @@ class ShaderPass:
             sw, sh = tex.size
             ox, oy = 0, 0
         else:
-            x1, y1, x2, y2 = -1, -1, 1, 1
-            self.vbo.write(nodex.make_quad(x1, y1, x2, y2).tobytes())
-            return
+            ox, oy, sw, sh = 0, 0, W, H
 
-        x1, y1, x2, y2 = nodex.pixels_to_ndc(ox, oy, sw, sh, W, H)
-        self.vbo.write(nodex.make_quad(x1, y1, x2, y2).tobytes())
\ No newline at end of file
+        quad = nodex.pixels_to_ndc(ox, oy, sw, sh, W, H)
+        if self._static_quad:
+            self.send_uniform("quad", quad)
+        else:
+            self.vbo.write(nodex.make_quad(*quad).tobytes())
\ No newline at end of file
@@ -0,0 +1,132 @@
+import weakref
+import pygame
+import moderngl
+import nodex
+
+from array import array
+
+from .primitive_batch import PrimitiveBatch
+
+# the quad corners, drawn as a triangle strip
+CORNERS = (0, 0, 1, 0, 0, 1, 1, 1)
+# floats per sprite: rect, texture rect, tint, angle
+INSTANCE_SIZE = 13
+
+class SpritePass:
+    def __init__(self, context : "nodex.Context", frag_prog : str = None):
+        """
+        Draws surfaces (the asset images) from textures kept on the GPU, instead of
+        blitting them into a surface uploaded every frame.
+        A texture is uploaded once per image, or once per spritesheet for the images cut
+        from one, so all the sprites of a sheet come from the same texture. The sprites
+        drawn in a row from the same texture are drawn by one instanced call, their
+        rect, texture rect, tint and angle streamed in a buffer.
+        The images are expected not to change once drawn, surfaces made every frame
+        (texts) belong in a PYGAME viewport.
+        """
+        self.context = context
+        gl_ctx = context._gl_context.gl_ctx
+        self.uniforms = {}
+        self.shader_prog = context._gl_context.programs.get(
+            context.shaders.get("_sprite_vertex"),
+            frag_prog or context.shaders.get("_sprite_fragment")
+        )
+        self.corners = gl_ctx.buffer(array("f", CORNERS).tobytes())
+        self.vbo = gl_ctx.buffer(reserve = 4, dynamic = True)
+        self.vao = gl_ctx.vertex_array(self.shader_prog, [
+            (self.corners, "2f", "in_corner"),
+            (self.vbo, "4f 4f 4f 1f/i", "in_rect", "in_source", "in_tint", "in_angle"),
+        ])
+        self.primitives = PrimitiveBatch(context)
+        self._sprites = []
+        # id of the surface textured -> (weak reference to it, texture)
+        self._textures = {}
+        # ids of the surfaces collected since, their texture is released on the next render
+        self._dead = []
+
+    @property
+    def textures(self):
+        return {f"sprites.{i}": (texture, 0) for i, (_, texture) in enumerate(self._textures.values())}
+
+    def _texture(self, root : pygame.Surface) -> moderngl.Texture:
+        entry = self._textures.get(id(root))
+        if entry is not None:
+            if entry[0]() is root:
+                return entry[1]
+            # a collected surface had the same id
+            self._release(id(root))
+        gl_context = self.context._gl_context
+        texture = gl_context.gl_ctx.texture(root.get_size(), 4)
+        texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        gl_context.write_texture(texture, root)
+        key = id(root)
+        self._textures[key] = (weakref.ref(root, lambda _: self._dead.append(key)), texture)
+        return texture
+
+    def _release(self, key):
+        _, texture = self._textures.pop(key)
+        self.context._gl_context.uploader.forget(texture)
+        texture.release()
+
+    def _release_dead(self):
+        while self._dead:
+            key = self._dead.pop()
+            entry = self._textures.get(key)
+            # the id may have been textured again since
+            if entry is not None and entry[0]() is None:
+                self._release(key)
+
+    def draw(self, surface : pygame.Surface, position, color = None, angle = 0):
+        self._sprites.append((surface, position, color, angle))
+
+    def set_uniform(self, name:str, value) -> None:
+        if name in self.uniforms:
+            self.uniforms[name] = value
+        else:
+            # a new dict, the render thread may be iterating the current one
+            self.uniforms = self.uniforms | {name: value}
+
+    def publish(self) -> None:
+        pass
+
+    def render(self) -> None:
+        self._release_dead()
+        program = self.shader_prog
+        program["size"] = self.context.window.internal_size
+        for name, value in self.uniforms.items():
+            if name in program:
+                program[name] = value
+        if "tex" in program:
+            program["tex"] = 0
+
+        # runs of sprites from the same texture, in the order they were drawn
+        runs = []
+        current, instances = None, None
+        for surface, (x, y), color, angle in self._sprites:
+            w, h = surface.get_size()
+            if w == 0 or h == 0:
+                continue
+            root = surface.get_abs_parent()
+            texture = self._texture(root)
+            if texture is not current:
+                current, instances = texture, array("f")
+                runs.append((texture, instances))
+            ox, oy = surface.get_abs_offset()
+            W, H = root.get_size()
+            r, g, b, *a = color or nodex.Color.WHITE
+            # the texture rows are bottom up
+            instances.extend((x, y, w, h, ox / W, 1 - oy / H, w / W, -h / H, r, g, b, a[0] if a else 255, angle))
+        self._sprites.clear()
+
+        gl_context = self.context._gl_context
+        for texture, instances in runs:
+            data = instances.tobytes()
+            # a new storage each time, the GPU may still read the previous one
+            self.vbo.orphan(len(data))
+            self.vbo.write(data)
+            gl_context.stats.count("upload_bytes", len(data))
+            gl_context.use_texture(texture, 0)
+            with gl_context.gpu_timer.measure(gl_context.stats.scope):
+                self.vao.render(moderngl.TRIANGLE_STRIP, vertices = 4, instances = len(instances) // INSTANCE_SIZE)
+            gl_context.stats.count("draw_calls")
+        self.primitives.render()
\ No newline at end of file
@@ -6,12 +6,18 @@ class WorldPass(PygamePass):
     def __init__(self, context : "nodex.Context", frag_prog=None): 
         self.context = context
         self.camera = Camera2D()
+        # the camera of the last published tick, the one used for rendering
+        self.render_camera = self.camera
         super().__init__(context, frag_prog, self.context.shaders.get("_world"))
     
     def draw(self, surf, position):
-        self.blit(surf, (position[0] - self.camera.position.x, position[1] - self.camera.position.y))
+        self.blit(surf, (position[0] - self.render_camera.position.x, position[1] - self.render_camera.position.y))
+
+    def publish(self):
+        self.render_camera = self.camera.copy()
     
     def render(self):
-        self.set_uniform("rotation", self.camera.rotation)
-        self.set_uniform("zoom", self.camera.zoom)
+        self.set_uniform("rotation", self.render_camera.rotation)
+        self.set_uniform("zoom", self.render_camera.zoom)
+        self.primitives.offset = (-self.render_camera.position.x, -self.render_camera.position.y)
         super().render()
\ No newline at end of file
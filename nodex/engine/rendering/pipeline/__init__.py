@@ -1,4 +1,6 @@
 from .renderer import Renderer 
 from .viewport import Viewport 
+from .draw_task import DrawTask, Circle, Line
 from .viewport_type import ViewportType
-from .post_process import PostProcess
\ No newline at end of file
+from .post_process import PostProcess
+from .stats import RenderStats
\ No newline at end of file
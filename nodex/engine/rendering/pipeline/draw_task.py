@@ -0,0 +1,39 @@
+import pygame
+
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class DrawTask:
+    """
+    A draw command recorded by Renderer.draw, rendered by its viewport.
+    The content is a surface, tinted by color in sprites viewports, or a primitive
+    (rect, circle, line) filled with color.
+    Billboard tasks drawing an asset reference it by name, the frame and
+    scale depend on the camera at render time.
+    """
+    content: pygame.Surface | pygame.Rect
+    position: tuple = (0, 0)
+    color: tuple = None
+    tex: str = "tex"
+    asset: str = None
+    angle: float = 0
+    previous_position: tuple = None
+
+
+@dataclass(slots=True, frozen=True)
+class Circle:
+    """
+    A filled circle, centered on the task position.
+    """
+    radius: float
+
+@dataclass(slots=True, frozen=True)
+class Line:
+    """
+    A line from the task position to the task position + vector.
+    """
+    vector: tuple
+    width: float = 1
+
+# drawn by the viewport primitive batch, not as surfaces
+PRIMITIVES = (pygame.Rect, Circle, Line)
\ No newline at end of file
@@ -6,17 +6,18 @@ class PostProcess:
         self.active_effects = set()
     
     def register_effect(self, name, frag_prog):
-        self.context._gl_context.register_effect(name, frag_prog) 
+        self.context.runtime.call_on_main(self.context._gl_context.register_effect, name, frag_prog) 
 
     def set_uniform(self, effect_name, uniform_name, value):
         self.context._gl_context.set_uniform(effect_name, uniform_name, value)
 
     def enable_effect(self, effect_name):
-        self.context._gl_context.post_process.add(effect_name)
+        # the set is replaced rather than modified, the render thread may be iterating it
+        self.context._gl_context.post_process = self.context._gl_context.post_process | {effect_name}
     
     def diseable_effect(self, effect_name):
         if effect_name in self.context._gl_context.post_process:
-            self.context._gl_context.post_process.remove(effect_name)
+            self.context._gl_context.post_process = self.context._gl_context.post_process - {effect_name}
 
 
     
@@ -6,13 +6,17 @@ from nodex.misc.color import Color
 
 from .viewport_type import ViewportType
 from .viewport import Viewport
+from .draw_task import DrawTask, Circle, Line, PRIMITIVES
 from ..cameras.camera2D import Camera2D
 from ..cameras.camera3D import Camera3D
 
+EMPTY_SURFACE = pygame.Surface((0, 0))
+
 
 class Renderer:
-    def __init__(self, context : "nodex.Context"):
+    def __init__(self, context : "nodex.Context", name = "renderer"):
         self.context = context 
+        self.name = name
         self.viewports: dict[str, Viewport] = {}
         self.next_order = 0 
 
@@ -30,14 +34,19 @@ class Renderer:
         if vp.type == ViewportType.MODE7:
             return vp.pass_.dynamic_pass.camera
 
-    def camera3D(self, viewport) -> Camera3D:
+    def camera3D(self, viewport, rendered = False) -> Camera3D:
         vp = self.viewports[viewport]
         if vp.type == ViewportType.MODE7: 
-            return vp.pass_.camera
+            return vp.pass_.render_camera if rendered else vp.pass_.camera
+
+    def draw(self, viewport, drawable = None, position = (0, 0), color = Color.WHITE, asset = None, angle = 0, previous_position = None): 
+        self.viewports[viewport].add_task(self.build_task(drawable, position, color, "tex", asset, angle, previous_position))
 
-    def draw(self, viewport, drawable = None, position = (0, 0), color = Color.WHITE, asset = None, angle = 0): 
-        task = self.build_task(drawable, position=position, color=color, tex="tex", asset=asset, angle=angle)
-        self.viewports[viewport].add_task(task)
+    def draw_circle(self, viewport, center, radius, color = Color.WHITE):
+        self.draw(viewport, Circle(radius), center, color)
+
+    def draw_line(self, viewport, start, end, color = Color.WHITE, width = 1):
+        self.draw(viewport, Line((end[0] - start[0], end[1] - start[1]), width), start, color)
 
     def draw_world(self, viewport, drawable = None, position = (0, 0), color = Color.WHITE, asset = None, angle = 0):
         camera = self.camera2D(viewport)
@@ -50,27 +59,40 @@ class Renderer:
     def set_uniform(self, viewport, name, value):
         self.viewports[viewport].pass_.set_uniform(name, value)
 
+    def store_cameras(self):
+        for viewport in self.viewports.values():
+            if viewport.type == ViewportType.MODE7:
+                viewport.pass_.camera.store()
+
     def clear(self):
         for viewport in self.viewports.values():
             viewport.clear()
+
+    def publish(self):
+        for viewport in self.viewports.values():
+            viewport.publish()
     
+    @property
+    def stats(self):
+        return self.context._gl_context.stats
+
     def render(self):
+        stats = self.stats
         for viewport in sorted(self.viewports.values(), key=attrgetter("order")):
-            if viewport.tasks or viewport.type == ViewportType.MODE7:
+            if viewport.frame_tasks or viewport.type == ViewportType.MODE7:
+                stats.scope = f"{self.name}.{viewport.name}"
+                stats.count("tasks", len(viewport.frame_tasks))
                 viewport.render()
+                self.context.profiler.lap(f"{self.name}.{viewport.name}")
 
-    def build_task(self, drawable, **kwargs):
-        task = {"content": drawable, "tex": kwargs["tex"], "angle": kwargs["angle"]}
-        if "asset" in kwargs and kwargs["asset"] is not None:
-            task["asset"] = kwargs["asset"]
-        
-        if isinstance(drawable, pygame.Rect):
-            task["color"] = kwargs["color"]
-        elif isinstance(drawable, pygame.Surface):
-            task["position"] = kwargs["position"] 
-        elif isinstance(drawable, str):
-            return self.build_task(self.context.assets.get_image(drawable), **kwargs)
-        elif drawable is None:
-            return self.build_task(pygame.Surface((0, 0)), **kwargs)
-            
-        return task
\ No newline at end of file
+    def build_task(self, drawable, position = (0, 0), color = Color.WHITE, tex = "tex", asset = None, angle = 0, previous_position = None) -> DrawTask:
+        if drawable is None:
+            # asset only tasks (billboards), nothing to draw as is
+            drawable = EMPTY_SURFACE
+        elif drawable.__class__ is str:
+            drawable = self.context.assets.get_image(drawable)
+        elif drawable.__class__ is pygame.Rect:
+            return DrawTask(drawable, (drawable.x, drawable.y), color, tex, asset, angle, previous_position)
+        elif drawable.__class__ in PRIMITIVES:
+            return DrawTask(drawable, position, color, tex, asset, angle, previous_position)
+        return DrawTask(drawable, position, color, tex, asset, angle, previous_position)
\ No newline at end of file
@@ -0,0 +1,85 @@
+import pygame
+import weakref
+
+from collections import Counter
+
+# counters, with their label on the overlay
+COUNTERS = {
+    "tasks": "t", "draw_calls": "dc", "upload_bytes": "up", "surfaces": "sf", 
+    "scales": "sc", "cache_hits": "hit", "cache_misses": "miss", "uniforms": "u",
+}
+LINE_HEIGHT = 9
+
+class RenderStats:
+    def __init__(self):
+        """
+        Counters of the rendering work, per viewport ("renderer.mode7", "post_process"...)
+        and per frame: draw tasks, vao.render calls, bytes written into textures, surfaces
+        drawn for the first time (so allocated since), transform.scale calls, billboard
+        scale cache hits and misses, and uniform values sent.
+        frame holds the frame being rendered, last the previous complete one.
+        The surfaces are only tracked while the overlay is shown or track_surfaces set,
+        the ones drawn before count as allocated the first frame after.
+        """
+        self.scope = None
+        self.frame : dict[str, Counter] = {}
+        self.last : dict[str, Counter] = {}
+        self.show = False
+        self.track_surfaces = False
+        self._seen = weakref.WeakSet()
+        self._font = None
+
+    def begin_frame(self):
+        self.last = self.frame
+        self.frame = {}
+
+    def count(self, name, value = 1):
+        counters = self.frame.get(self.scope)
+        if counters is None:
+            counters = self.frame[self.scope] = Counter()
+        counters[name] += value
+
+    @property
+    def tracking_surfaces(self) -> bool:
+        return self.show or self.track_surfaces
+
+    def surface(self, surface : pygame.Surface):
+        """
+        Counts the surface as an allocation the first time it's drawn.
+        """
+        if surface not in self._seen:
+            self._seen.add(surface)
+            self.count("surfaces")
+
+    def totals(self, frame = None) -> Counter:
+        totals = Counter()
+        for counters in (frame if frame is not None else self.last).values():
+            totals.update(counters)
+        return totals
+
+    def toggle(self):
+        self.show = not self.show
+
+    def draw(self, context, viewport = "stats"):
+        """
+        Draws the last frame counters on the overlay, one line per viewport.
+        """
+        overlay = context.overlay.get_viewport(viewport)
+        # written straight into the published tasks, like the profiler graph
+        overlay.frame_tasks = []
+        if not self.show:
+            return
+        if self._font is None:
+            self._font = pygame.font.Font(None, 12)
+        lines = [("", self.totals())] + sorted(self.last.items(), key=lambda item: str(item[0]))
+        for i, (scope, counters) in enumerate(lines):
+            text = f"{scope or 'total'}: " + " ".join(
+                f"{label}{_format(counters[name])}" for name, label in COUNTERS.items() if counters[name]
+            )
+            surface = self._font.render(text, False, (255, 255, 255), (0, 0, 0))
+            overlay.frame_tasks.append(context.overlay.build_task(
+                surface, position=(0, i * LINE_HEIGHT), color=None, tex="tex", asset=None, angle=0
+            ))
+
+def _format(value):
+    return f"{value / 1000:.0f}k" if value >= 10000 else str(value)
@@ -2,6 +2,7 @@ import pygame
 import nodex
 
 from .viewport_type import ViewportType 
+from .draw_task import PRIMITIVES
 
 PASS_FACTORY = {
     ViewportType.BASIC : lambda ctx, frag, vert, _ : nodex.ShaderPass(ctx, frag, vert),
@@ -9,6 +10,7 @@ PASS_FACTORY = {
     ViewportType.WORLD : lambda ctx, frag, vert, _ : nodex.WorldPass(ctx, frag),
     ViewportType.MODE7 : lambda ctx, frag, vert, settings: nodex.Mode7Pass(ctx, settings),
     ViewportType.BILLBOARD : lambda ctx, frag, vert, settings: nodex.BillboardPass(ctx, frag, settings),
+    ViewportType.SPRITES : lambda ctx, frag, vert, _ : nodex.SpritePass(ctx, frag),
 }
 
 class Viewport:
@@ -18,8 +20,12 @@ class Viewport:
         self.type = type
         self.order = order
         self.tasks = []
+        # tasks of the last finished tick, the ones rendered
+        self.frame_tasks = []
         self.rendering_id = 0
         self.pass_ = PASS_FACTORY[type](context, frag_prog, vert_prog, settings)
+        # resolved once, the viewport type doesn't change
+        self._draw = DRAW_DISPATCH_TABLE[type]
 
     def add_task(self, task):
         self.tasks.append(task)
@@ -27,46 +33,78 @@ class Viewport:
     def clear(self):
         self.tasks.clear()
 
+    def publish(self):
+        self.frame_tasks = self.tasks
+        self.tasks = []
+        self.pass_.publish()
+
     def render(self):
-        for task in self.tasks:
-            handler = TASK_DISPATCH_TABLE[type(task["content"])]
-            handler(self, task)
-            if self.type == ViewportType.BASIC:
+        draw = self._draw
+        stats = self.context._gl_context.stats
+        # a set lookup per surface, only paid when someone reads the counter
+        track_surfaces = stats.tracking_surfaces
+        primitives = self.pass_.primitives
+        basic = self.type == ViewportType.BASIC
+        for task in self.frame_tasks:
+            surface = task.content
+            if surface.__class__ in PRIMITIVES:
+                primitives.add(task)
+                continue
+            if track_surfaces:
+                stats.surface(surface)
+            draw(self, surface, task)
+            if basic:
+                # the primitives drawn before the surface go under it
+                primitives.render()
                 self.pass_.render()
             self.rendering_id += 1
 
-        if self.type != ViewportType.BASIC:
+        if basic:
+            primitives.render()
+        else:
             self.pass_.render()
 
-        self.tasks.clear()
         self.rendering_id = 0
 
-    def handle_pygame_rect(self, task):
-        rect = task["content"]
-        surface = pygame.Surface((rect.w, rect.h)) 
-        surface.fill(task["color"]) 
-        self.handle_pygame_surf(task | {"content": surface, "position": (rect.x, rect.y)})
-
-    def handle_pygame_surf(self, task):
-        surface = task["content"]
-        if self.type == ViewportType.BASIC:
-            pos = task["position"]
-            self.pass_.set_viewport(pos[0], pos[1], surface.get_width(), surface.get_height())
-            self.pass_.dump_pygame_surf(task["tex"], surface)
-        elif self.type == ViewportType.PYGAME:
-            self.pass_.blit(surface, task["position"])
-        elif self.type == ViewportType.MODE7:
-            self.pass_.draw(surface, task["position"])
-        elif self.type == ViewportType.BILLBOARD:
-            if "asset" in task:
-                self.pass_.draw(task["asset"], task["position"], task["angle"])
-            else:
-                self.pass_.draw(surface, task["position"], task["angle"])
+    def draw_basic(self, surface, task):
+        pos = task.position
+        self.pass_.set_viewport(pos[0], pos[1], surface.get_width(), surface.get_height())
+        self.pass_.dump_pygame_surf(task.tex, surface)
+
+    def draw_pygame(self, surface, task):
+        self.pass_.blit(surface, task.position)
+
+    def draw_world(self, surface, task):
+        # world passes are drawn into directly, through their camera
+        pass
+
+    def draw_mode7(self, surface, task):
+        self.pass_.draw(surface, task.position)
+
+    def draw_billboard(self, surface, task):
+        position = self.interpolated_position(task)
+        if task.asset is not None:
+            self.pass_.draw(task.asset, position, task.angle)
+        else:
+            self.pass_.draw(surface, position, task.angle)
+
+    def draw_sprites(self, surface, task):
+        self.pass_.draw(surface, task.position, task.color, task.angle)
+
+    def interpolated_position(self, task):
+        position = task.position
+        if task.previous_position is None or self.context.alpha >= 1:
+            return position
+        return nodex.lerp(task.previous_position, position, self.context.alpha)
 
     def set_uniform(self, name, value):
         self.pass_.set_uniform(name, value)
 
-TASK_DISPATCH_TABLE = {
-    pygame.Surface: Viewport.handle_pygame_surf,
-    pygame.Rect   : Viewport.handle_pygame_rect,  
+DRAW_DISPATCH_TABLE = {
+    ViewportType.BASIC : Viewport.draw_basic,
+    ViewportType.PYGAME : Viewport.draw_pygame,
+    ViewportType.WORLD : Viewport.draw_world,
+    ViewportType.MODE7 : Viewport.draw_mode7,
+    ViewportType.BILLBOARD : Viewport.draw_billboard,
+    ViewportType.SPRITES : Viewport.draw_sprites,
 }
\ No newline at end of file
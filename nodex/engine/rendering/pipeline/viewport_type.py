@@ -6,3 +6,4 @@ class ViewportType(Enum):
     WORLD = auto()
     MODE7 = auto()
     BILLBOARD = auto()
+    SPRITES = auto()
\ No newline at end of file
@@ -12,13 +12,19 @@ class AssetsManager:
 
     def register_surface(self, name, surface):
         self._assets[name] = surface 
+        self.context.textures.surface_registered(name, surface)
 
-    def _load_image(self, path, scale=(1, 1)):
+    def decode_image(self, path):
         try:
-            surface = pygame.image.load(path).convert_alpha()
+            return pygame.image.load(path)
         except:
             raise FileNotFoundError(f"'{path}' file not found")
-        
+
+    def _load_image(self, path, scale=(1, 1)):
+        return self._prepare_image(self.decode_image(path), scale)
+
+    def _prepare_image(self, surface, scale=(1, 1)):
+        surface = surface.convert_alpha()
         if scale == (1, 1):
             return surface
         w, h = surface.get_size()
@@ -27,9 +33,27 @@ class AssetsManager:
     def load_image(self, name, path, scale=(1, 1)):
         self.register_surface(name, self._load_image(path, scale))
     
+    def queue_image(self, name, path, scale=(1, 1)):
+        """
+        Same as load_image, but the file is decoded on a loader thread.
+        """
+        self.context.loader.queue(
+            self.decode_image, 
+            lambda surface: self.register_surface(name, self._prepare_image(surface, scale)),
+            path
+        )
+
     def load_spritesheet(self, name, path, tile_size, scale=(1, 1)):
-       
-        spritesheet_surface = self._load_image(path, scale)
+        self._register_spritesheet(name, self._load_image(path, scale), tile_size)
+
+    def queue_spritesheet(self, name, path, tile_size, scale=(1, 1)):
+        self.context.loader.queue(
+            self.decode_image, 
+            lambda surface: self._register_spritesheet(name, self._prepare_image(surface, scale), tile_size),
+            path
+        )
+
+    def _register_spritesheet(self, name, spritesheet_surface, tile_size):
         self.register_surface(name, spritesheet_surface)
         spritesheet_size = spritesheet_surface.get_size()
         self._spritesheets[name] = {"surface" : None, "size" : (
@@ -45,6 +69,9 @@ class AssetsManager:
                     tile_size[1]
                 )))
         
+    def has_image(self, name):
+        return name in self._assets
+
     def get_image(self, name):
         if name in self._assets:
             return self._assets[name]
@@ -0,0 +1,75 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..core.context import Context
+
+class AsyncLoader:
+    def __init__(self, context : "Context", workers = 4, budget = 0.004):
+        """
+        Decodes files on worker threads, the decoded results are then finalised
+        (convert_alpha, GL upload, registration) on the main thread in update,
+        which stops once the per frame time budget (in seconds) is spent.
+        """
+        self.context = context
+        self.workers = workers
+        self.budget = budget
+        self._executor = None
+        self._pending = []
+        self._callbacks = []
+        self.queued = 0
+        self.loaded = 0
+
+    def queue(self, decode, finalize, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="nodex-loader")
+        self._pending.append((self._executor.submit(decode, *args), finalize))
+        self.queued += 1
+
+    def when_done(self, callback):
+        """
+        Calls callback once everything queued so far is loaded.
+        """
+        if self.done:
+            callback()
+        else:
+            self._callbacks.append(callback)
+
+    def update(self):
+        if not self._pending:
+            return
+        start = time.perf_counter()
+        for item in list(self._pending):
+            future, finalize = item
+            if not future.done():
+                continue
+            self._pending.remove(item)
+            finalize(future.result())
+            self.loaded += 1
+            if time.perf_counter() - start > self.budget:
+                break
+        if self.done:
+            for callback in self._callbacks:
+                callback()
+            self._callbacks.clear()
+
+    def wait(self):
+        """
+        Blocks until everything queued is loaded, ignoring the time budget.
+        """
+        while not self.done:
+            for future, _ in self._pending:
+                future.result()
+            budget, self.budget = self.budget, float("inf")
+            self.update()
+            self.budget = budget
+
+    @property
+    def done(self):
+        return not self._pending
+
+    @property
+    def progress(self):
+        return self.loaded / self.queued if self.queued else 1.0
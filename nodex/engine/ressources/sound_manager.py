@@ -12,6 +12,9 @@ class SoundManager:
     def load_sound(self, name, path):
         self.sound_loader.load_sound(name, path)
 
+    def queue_sound(self, name, path):
+        self.sound_loader.queue_sound(name, path)
+
     def track(self, name, volume=1.0, loops=0, fade_in_ms=None):
         sound = self.sound_loader.get_sound(name).copy()
         if fade_in_ms:
@@ -0,0 +1,88 @@
+import os
+import moderngl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from ..core.context import Context
+
+class TextureRegistry:
+    def __init__(self, context : "Context"):
+        """
+        GPU textures shared between the passes, keyed by the name of an image of the
+        assets, or by the path of an image file. Each image is uploaded once, the passes
+        using it hold a reference, the texture is released with the last one.
+        Names of images still loading (queued in the assets) are resolved once registered.
+        """
+        self.context = context
+        # key -> [texture, references]
+        self._textures = {}
+        # key -> (filter, callbacks waiting for the texture)
+        self._pending = {}
+
+    def __contains__(self, key):
+        return key in self._textures
+
+    def acquire(self, key, callback, filter = moderngl.NEAREST):
+        """
+        Calls callback with the texture of key, right away if it's uploaded or the image
+        loaded, else once it is. Each call holds a reference, given back with release.
+        """
+        if key in self._textures:
+            self._textures[key][1] += 1
+            callback(self._textures[key][0])
+        elif key in self._pending:
+            self._pending[key][1].append(callback)
+        elif self.context.assets.has_image(key):
+            self._upload(key, self.context.assets.get_image(key), filter)
+            self.acquire(key, callback)
+        else:
+            self._pending[key] = (filter, [callback])
+            if os.path.isfile(key):
+                self.context.loader.queue(
+                    self.context.assets.decode_image,
+                    lambda surface: self._loaded(key, surface.convert_alpha()),
+                    key
+                )
+            # else an image of the assets not registered yet, see surface_registered
+
+    def cancel(self, key, callback):
+        """
+        Withdraws a callback still waiting for the texture of key, it holds no reference.
+        """
+        pending = self._pending.get(key)
+        if pending is not None and callback in pending[1]:
+            pending[1].remove(callback)
+
+    def surface_registered(self, name, surface):
+        """
+        Called by the assets, uploads the image if a pass is waiting for it.
+        """
+        if name in self._pending:
+            self._loaded(name, surface)
+
+    def _loaded(self, key, surface):
+        filter, callbacks = self._pending.pop(key)
+        # the passes waiting for it were all unbound meanwhile
+        if not callbacks:
+            return
+        self._upload(key, surface, filter)
+        for callback in callbacks:
+            self.acquire(key, callback)
+
+    def _upload(self, key, surface, filter):
+        gl_context = self.context._gl_context
+        texture = gl_context.gl_ctx.texture(surface.get_size(), 4)
+        texture.filter = (filter, filter)
+        gl_context.write_texture(texture, surface)
+        self._textures[key] = [texture, 0]
+
+    def release(self, key):
+        entry = self._textures[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._textures[key]
+            self.context._gl_context.uploader.forget(entry[0])
+            entry[0].release()
+
+    def references(self, key) -> int:
+        return self._textures[key][1] if key in self._textures else 0
\ No newline at end of file
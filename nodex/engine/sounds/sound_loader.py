@@ -10,6 +10,14 @@ class SoundLoader:
     def load_sound(self, name:str, file:str):
         self.sounds[name] = Sound(self.context, pygame.mixer.Sound(file))
 
+    def queue_sound(self, name:str, file:str):
+        # pygame.mixer.Sound fully decodes the file, which is what takes time for the mp3s
+        self.context.loader.queue(
+            pygame.mixer.Sound,
+            lambda sound: self.sounds.__setitem__(name, Sound(self.context, sound)),
+            file
+        )
+
     def get_sound(self, name:str, copy:bool = True):
         if copy:
             return self.sounds.get(name).copy()
@@ -36,7 +36,8 @@ class GameNode:
         if self.flags.update:
             self.update() 
         if self.flags.propagate:
-            for child in sorted(self.children, key=attrgetter("order")):
+            # the id keeps the update order stable between runs (sets aren't)
+            for child in sorted(self.children, key=attrgetter("order", "id")):
                 child.update_all()
         if self.flags.render:
             self.render()
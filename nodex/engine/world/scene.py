@@ -1,3 +1,5 @@
+from operator import attrgetter
+
 class Scene:
     def __init__(self, context):
         self.context = context 
@@ -11,5 +13,5 @@ class Scene:
             node.load()
 
     def update(self):   
-        for node in self.nodes:
+        for node in sorted(self.nodes, key=attrgetter("order", "id")):
             node.update_all()
@@ -19,6 +19,7 @@ class SceneManager:
     def switch(self, scene):
         self.current_scene = scene
         self.scenes[scene].load()
+        self.context.memory.scene_switched(scene)
 
     def add_scene(self, name):
         self.scenes[name] = Scene(self.context)
@@ -55,5 +55,8 @@ def distance2D(pos1, pos2):
         (pos1[1] - pos2[1]) ** 2
     )
 
+def lerp(a, b, t):
+    return tuple(x + (y - x) * t for x, y in zip(a, b))
+
 def dot(a, b):
     return a[0] * b[0] + a[1] * b[1]
\ No newline at end of file
@@ -6,11 +6,13 @@ class Entity3D(nodex.GameNode):
         super().__init__(context) 
         self.position = pygame.math.Vector3(0, 0, 0)
         self.velocity = pygame.math.Vector3(0, 0, 0) 
+        self.previous_position = pygame.math.Vector3(0, 0, 0)
         self.down_gravity = 0.05
         self.up_gravity = 0.05
 
     
     def update(self): 
+        self.previous_position = pygame.math.Vector3(self.position)
         self.position.x += self.velocity.x * self.context.dt 
         self.position.y += self.velocity.y * self.context.dt 
         self.position.z += self.velocity.z * self.context.dt
@@ -35,6 +37,7 @@ class Entity3D(nodex.GameNode):
         self.position.x = x 
         self.position.y = y 
         self.position.z = z
+        self.previous_position = pygame.math.Vector3(self.position)
 
     def set_velocity(self, x, y, z):
         self.velocity.x = x 
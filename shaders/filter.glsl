@@ -1,3 +1,5 @@
+#version 330 core
+
 uniform sampler2D texture0;
 
 in vec2 uv;